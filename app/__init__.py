@@ -1,38 +1,103 @@
 from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
 from flask_login import LoginManager
-from flask_migrate import Migrate
 from datetime import datetime
 import os
 
+import click
+
+from .database import DEFAULT_PRAGMAS, apply_pragmas, engine_options
+
 db = SQLAlchemy()
 login_manager = LoginManager()
-migrate = Migrate()
 
-def create_app():
-    app = Flask(__name__)
+
+def running_from_cli():
+    # `flask ...` loads the app inside a click context; run.py and the
+    # Windows service don't
+    return click.get_current_context(silent=True) is not None
+
+
+def init_migrate(app):
+    # flask_migrate pulls in alembic, which only the `flask db` commands need
+    from flask_migrate import Migrate
+    Migrate(app, db)
+
+
+def create_app(config=None):
+    app = Flask(__name__, instance_relative_config=True)
     app.config['SECRET_KEY'] = 'your-secret-key-here'  # Change this in production
     app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///timetracker.db'
+    app.config['SQLITE_PRAGMAS'] = dict(DEFAULT_PRAGMAS)
+    # Tables are managed by flask_migrate; set to False to skip db.create_all()
+    app.config['CREATE_ALL_ON_STARTUP'] = True
+    # None means: only when started through the `flask` command
+    app.config['LOAD_MIGRATIONS'] = None
+
+    # Site settings: instance/config.py, then the file named by
+    # LOOM_TRACKER_CONFIG, then LOOM_* environment variables
+    # (e.g. LOOM_DB_POOL_SIZE=10, LOOM_SQLITE_PRAGMAS__busy_timeout=10000)
+    app.config.from_pyfile('config.py', silent=True)
+    app.config.from_envvar('LOOM_TRACKER_CONFIG', silent=True)
+    app.config.from_prefixed_env('LOOM')
+    if config:
+        # Overrides for scripts and benchmarks, e.g. a throwaway database
+        app.config.update(config)
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = engine_options(app.config)
     
     db.init_app(app)
+    with app.app_context():
+        apply_pragmas(db.engine, app.config['SQLITE_PRAGMAS'])
     login_manager.init_app(app)
     login_manager.login_view = 'auth.login'
 
-    migrate.init_app(app, db)
+    load_migrations = app.config['LOAD_MIGRATIONS']
+    if load_migrations or (load_migrations is None and running_from_cli()):
+        init_migrate(app)
     
-    from .models import User
-    
-    @login_manager.user_loader
-    def load_user(user_id):
-        return User.query.get(int(user_id))
+    # after_request handlers run last-registered first, so registering
+    # compression before everything else lets it see the final body
+    from . import compression
+    compression.init_app(app)
+
+    # ?v=<content hash> on static URLs, served with a year-long max-age
+    from . import fingerprint
+    fingerprint.init_app(app)
+
+    # asset_url() for the vendored front-end libraries
+    from . import assets
+    assets.init_app(app)
+
+    # Flask-Login's user_loader, served from a TTL cache
+    from . import identity
+    identity.init_app(app, login_manager)
+
+    from . import instrumentation
+    instrumentation.init_app(app)
+
+    # Version counters behind ETags and the in-process caches
+    from . import versions
+    versions.init_app(app)
     
     from .auth import auth as auth_blueprint
     from .main import main as main_blueprint
     
     app.register_blueprint(auth_blueprint)
     app.register_blueprint(main_blueprint)
-    
-    with app.app_context():
-        db.create_all()
+
+    from .commands import register_commands
+    register_commands(app)
+
+    from .jobs import export_jobs
+    export_jobs.init_app(app)
+
+    from . import backup
+    backup.init_app(app)
+
+    if app.config['CREATE_ALL_ON_STARTUP']:
+        from . import rollup
+        with app.app_context():
+            db.create_all()
+            rollup.backfill_if_empty()
     
     return app
@@ -0,0 +1,428 @@
+"""Vendored front-end libraries and the `flask assets` build that trims them.
+
+`flask assets fetch` downloads the pinned upstream files into
+static/vendor, checking each against its sha256 in VENDOR. `flask assets
+build` writes the trimmed, minified, content-hashed copies templates link
+to into static/dist, with precompressed .gz/.br siblings and a
+manifest.json; only static/dist is committed. The manifest records a
+digest of the templates and pinned sources it was built from; while it's
+out of date (and always under debug), asset_url() links the untrimmed
+vendored files instead where they have been fetched. Nothing is ever
+linked from a CDN.
+"""
+import gzip
+import hashlib
+import json
+import logging
+import os
+import re
+import shutil
+import urllib.parse
+import urllib.request
+from collections import namedtuple
+
+from flask import current_app, url_for
+
+from .compression import load_brotli
+from .fingerprint import HASHED_DIR
+
+logger = logging.getLogger(__name__)
+
+# Bump when the build output changes for the same inputs
+BUILD_VERSION = 2
+MANIFEST = 'manifest.json'
+
+# Vendored file -> where it came from and the sha256 its content must have
+Vendored = namedtuple('Vendored', 'url sha256')
+VENDOR = {
+    'vendor/bootswatch-5.1.3/darkly/bootstrap.min.css': Vendored(
+        'https://cdn.jsdelivr.net/npm/bootswatch@5.1.3/dist/darkly/bootstrap.min.css',
+        '5598bfaff442d4cae2b5c184d98cb16ff0028bc5883a3d58ec11eeb2517cfba2'),
+    'vendor/bootstrap-5.1.3/js/bootstrap.min.js': Vendored(
+        'https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/js/bootstrap.min.js',
+        '70c3d690bdc5ce3b9a1527c46044989a3176e610882fa99f4523e75bc395bcce'),
+    'vendor/bootstrap-icons-1.7.2/bootstrap-icons.svg': Vendored(
+        'https://cdn.jsdelivr.net/npm/bootstrap-icons@1.7.2/bootstrap-icons.svg',
+        '009ac47676381edee116e206d832b1e55d9e88dc27da43c34daba9693967ed58'),
+    # Unminified standalone build: the build minifies it with rjsmin
+    'vendor/vis-timeline-7.7.3/vis-timeline-graph2d.js': Vendored(
+        'https://unpkg.com/vis-timeline@7.7.3/standalone/umd/vis-timeline-graph2d.js',
+        '8673378fc7094d11603b14f029f1bc36632146ca647a0e82c2062dbe9dce03b3'),
+    'vendor/vis-timeline-7.7.3/vis-timeline-graph2d.css': Vendored(
+        'https://unpkg.com/vis-timeline@7.7.3/styles/vis-timeline-graph2d.css',
+        'd68f85a8fc419efd1d44d85ca6542e4b047a92d9d766a49ed6ca8864eb0c7ff7'),
+}
+
+# What templates link to. build(source, used) turns the vendored source
+# into the served file.
+Bundle = namedtuple('Bundle', 'source build')
+# Words found in the templates and scripts, and the bi-* icon names among them
+Used = namedtuple('Used', 'tokens icons')
+
+COMPRESSIBLE = ('.css', '.js', '.svg')
+
+_SOURCE_MAP = re.compile(r'\n?/[/*]# sourceMappingURL=[^\n]*')
+_TOKEN = re.compile(r'[A-Za-z_][\w-]*')
+_ICON = re.compile(r'\bbi-([a-z0-9]+(?:-[a-z0-9]+)*)')
+_CLASS = re.compile(r'\.(-?[_a-zA-Z][\w-]*)')
+_NOT = re.compile(r':not\([^()]*\)')
+_ATTRIBUTE = re.compile(r'\[[^\]]*\]')
+
+
+class AssetError(Exception):
+    pass
+
+
+# CSS
+
+def _skip_string(css, i):
+    quote = css[i]
+    i += 1
+    while i < len(css) and css[i] != quote:
+        i += 2 if css[i] == '\\' else 1
+    return i + 1
+
+
+def _matching_brace(css, i):
+    depth = 0
+    while i < len(css):
+        if css[i] in '"\'':
+            i = _skip_string(css, i)
+            continue
+        if css[i] == '{':
+            depth += 1
+        elif css[i] == '}':
+            depth -= 1
+            if depth == 0:
+                return i
+        i += 1
+    raise AssetError('Unbalanced braces in stylesheet')
+
+
+def parse_css(css, i=0):
+    """Split a stylesheet into nodes, up to the end or an unmatched '}'.
+
+    Nodes are ('comment', text), ('statement', text), ('rule', prelude,
+    body) and ('group', prelude, children) for @media and @supports.
+    Returns (nodes, index after the last one).
+    """
+    nodes = []
+    start = i
+    parens = 0
+    while i < len(css):
+        c = css[i]
+        if c in '"\'':
+            i = _skip_string(css, i)
+            continue
+        if css.startswith('/*', i):
+            end = css.index('*/', i) + 2
+            if not css[start:i].strip():
+                nodes.append(('comment', css[i:end]))
+                start = end
+            i = end
+            continue
+        if c == '(':
+            parens += 1
+        elif c == ')':
+            parens -= 1
+        elif parens == 0 and c == ';':
+            nodes.append(('statement', css[start:i + 1].strip()))
+            start = i + 1
+        elif parens == 0 and c == '{':
+            prelude = css[start:i].strip()
+            if prelude.startswith(('@media', '@supports')):
+                children, i = parse_css(css, i + 1)
+                nodes.append(('group', prelude, children))
+            else:
+                end = _matching_brace(css, i)
+                nodes.append(('rule', prelude, css[i + 1:end]))
+                i = end + 1
+            start = i
+            continue
+        elif c == '}':
+            return nodes, i + 1
+        i += 1
+    return nodes, i
+
+
+def render_css(nodes):
+    parts = []
+    for node in nodes:
+        if node[0] in ('comment', 'statement'):
+            parts.append(node[1])
+        elif node[0] == 'rule':
+            parts.append(f'{node[1]}{{{node[2]}}}')
+        else:
+            parts.append(f'{node[1]}{{{render_css(node[2])}}}')
+    return ''.join(parts)
+
+
+def split_selectors(prelude):
+    selectors, depth, start = [], 0, 0
+    for i, c in enumerate(prelude):
+        if c in '([':
+            depth += 1
+        elif c in ')]':
+            depth -= 1
+        elif c == ',' and depth == 0:
+            selectors.append(prelude[start:i])
+            start = i + 1
+    selectors.append(prelude[start:])
+    return selectors
+
+
+def selector_used(selector, used):
+    if '\\' in selector:
+        return True
+    # Classes under :not() or inside attribute values don't have to be present
+    bare = _ATTRIBUTE.sub('', _NOT.sub('', selector))
+    return all(name in used for name in _CLASS.findall(bare))
+
+
+def purge_css(nodes, used):
+    """Drop rules whose selectors need a class that never appears in used."""
+    kept = []
+    for node in nodes:
+        if node[0] == 'statement':
+            # Remote @imports (bootswatch pulls Lato from Google) defeat self-hosting
+            if node[1].startswith('@import') and '://' in node[1]:
+                continue
+            kept.append(node)
+        elif node[0] == 'group':
+            children = purge_css(node[2], used)
+            if children:
+                kept.append(('group', node[1], children))
+        elif node[0] == 'rule' and not node[1].startswith('@'):
+            selectors = [s for s in split_selectors(node[1]) if selector_used(s, used)]
+            if selectors:
+                kept.append(('rule', ','.join(selectors), node[2]))
+        else:
+            kept.append(node)
+    return kept
+
+
+# Builders: (source bytes, Used) -> bytes
+
+def copy(data, used):
+    return _SOURCE_MAP.sub('', data.decode('utf-8')).encode('utf-8')
+
+
+def minify_js(data, used):
+    try:
+        import rjsmin
+    except ImportError:
+        raise AssetError('Minifying scripts requires the rjsmin package')
+    script = copy(data, used).decode('utf-8')
+    # Keep the license header, which isn't always a /*! comment
+    header = script[:script.index('*/') + 2] + '\n' if script.startswith('/*') else ''
+    return (header + rjsmin.jsmin(script, keep_bang_comments=True)).encode('utf-8')
+
+
+def minify_css(data, used):
+    # For stylesheets whose classes are added by script, so can't be trimmed
+    try:
+        import rcssmin
+    except ImportError:
+        raise AssetError('Minifying stylesheets requires the rcssmin package')
+    return rcssmin.cssmin(copy(data, used).decode('utf-8'), keep_bang_comments=True).encode('utf-8')
+
+
+def trim_css(data, used):
+    css = _SOURCE_MAP.sub('', data.decode('utf-8'))
+    nodes, _ = parse_css(css)
+    return render_css(purge_css(nodes, used.tokens)).encode('utf-8')
+
+
+ICON_BASE = (
+    '[class^="bi-"]::before,[class*=" bi-"]::before{display:inline-block;content:"";width:1em;'
+    'height:1em;vertical-align:-.125em;background-color:currentColor;'
+    '-webkit-mask:no-repeat center/100% 100%;mask:no-repeat center/100% 100%}'
+)
+
+
+def icon_css(data, used):
+    """Masks for just the bi-* icons in use, cut from the bootstrap-icons sprite."""
+    sprite = data.decode('utf-8')
+    rules = [ICON_BASE]
+    for name in sorted(used.icons):
+        symbol = re.search(rf'<symbol([^>]*)\bid="{re.escape(name)}"([^>]*)>(.*?)</symbol>', sprite, re.S)
+        if not symbol:
+            logger.warning('bi-%s is not in the icon sprite', name)
+            continue
+        view_box = re.search(r'viewBox="([^"]*)"', symbol.group(1) + symbol.group(2)).group(1)
+        svg = f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="{view_box}">{symbol.group(3)}</svg>'
+        uri = 'data:image/svg+xml,' + urllib.parse.quote(svg.replace('"', "'"), safe=" '=:/.,-")
+        rules.append(f'.bi-{name}::before{{-webkit-mask-image:url("{uri}");mask-image:url("{uri}")}}')
+    return ''.join(rules).encode('utf-8')
+
+
+BUNDLES = {
+    'bootstrap.css': Bundle('vendor/bootswatch-5.1.3/darkly/bootstrap.min.css', trim_css),
+    'bootstrap.js': Bundle('vendor/bootstrap-5.1.3/js/bootstrap.min.js', copy),
+    'icons.css': Bundle('vendor/bootstrap-icons-1.7.2/bootstrap-icons.svg', icon_css),
+    'vis-timeline.js': Bundle('vendor/vis-timeline-7.7.3/vis-timeline-graph2d.js', minify_js),
+    'vis-timeline.css': Bundle('vendor/vis-timeline-7.7.3/vis-timeline-graph2d.css', minify_css),
+}
+
+
+# Build
+
+def _template_files(app):
+    folder = os.path.join(app.root_path, app.template_folder)
+    for root, _, names in os.walk(folder):
+        for name in sorted(names):
+            if name.endswith('.html'):
+                yield os.path.join(root, name)
+
+
+def _read(path):
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def inputs_digest(app):
+    """Hash of everything a build depends on, to tell when the manifest is stale.
+
+    Sources count by their pinned sha256, which the build enforces, so a
+    checkout that hasn't fetched them still finds the committed build fresh.
+    """
+    digest = hashlib.sha256(str(BUILD_VERSION).encode())
+    for path in sorted(_template_files(app)):
+        digest.update(os.path.relpath(path, app.root_path).encode())
+        digest.update(_read(path))
+    for source in sorted({bundle.source for bundle in BUNDLES.values()}):
+        digest.update(f'{source}:{VENDOR[source].sha256}'.encode())
+    return digest.hexdigest()
+
+
+def verify(app, path):
+    """Content of the vendored file at path, or AssetError if it's missing or not the pinned one."""
+    try:
+        data = _read(os.path.join(app.static_folder, path))
+    except OSError:
+        raise AssetError(f'{path} is not vendored; run `flask assets fetch`')
+    _check(path, data)
+    return data
+
+
+def _check(path, data):
+    actual = hashlib.sha256(data).hexdigest()
+    if actual != VENDOR[path].sha256:
+        raise AssetError(f'{path} has sha256 {actual}, expected {VENDOR[path].sha256}')
+
+
+def used_names(app):
+    """Every word in the templates and scripts, plus the bi-* icons referenced."""
+    tokens, icons = set(), set()
+    texts = [_read(path).decode('utf-8') for path in _template_files(app)]
+    icons.update(name for text in texts for name in _ICON.findall(text))
+    # Bootstrap's JS toggles classes (show, modal-open, ...) the templates never mention
+    script = os.path.join(app.static_folder, BUNDLES['bootstrap.js'].source)
+    if os.path.exists(script):
+        texts.append(_read(script).decode('utf-8'))
+    for text in texts:
+        tokens.update(_TOKEN.findall(text))
+    return Used(tokens, icons)
+
+
+def _hashed_name(name, data):
+    stem, extension = os.path.splitext(name)
+    return f'{stem}.{hashlib.sha256(data).hexdigest()[:12]}{extension}'
+
+
+def _write(path, data):
+    with open(path, 'wb') as f:
+        f.write(data)
+
+
+def build(app):
+    """Rebuild static/dist and its manifest. Returns {bundle: (path, bytes in, bytes out)}.
+
+    Raises AssetError, leaving static/dist alone, if a vendored source is
+    missing or doesn't match its pinned sha256, or a builder can't run.
+    """
+    sources = {bundle.source: verify(app, bundle.source) for bundle in BUNDLES.values()}
+    used = used_names(app)
+    outputs = {name: bundle.build(sources[bundle.source], used) for name, bundle in BUNDLES.items()}
+
+    dist = os.path.join(app.static_folder, HASHED_DIR)
+    shutil.rmtree(dist, ignore_errors=True)
+    os.makedirs(dist)
+    brotli = load_brotli()
+
+    files, report = {}, {}
+    for name, output in outputs.items():
+        filename = _hashed_name(name, output)
+        path = os.path.join(dist, filename)
+        _write(path, output)
+        if filename.endswith(COMPRESSIBLE):
+            _write(path + '.gz', gzip.compress(output, 9, mtime=0))
+            if brotli:
+                _write(path + '.br', brotli.compress(output, quality=11))
+        files[name] = f'{HASHED_DIR}/{filename}'
+        report[name] = (files[name], len(sources[BUNDLES[name].source]), len(output))
+
+    with open(os.path.join(dist, MANIFEST), 'w') as f:
+        json.dump({'inputs': inputs_digest(app), 'files': files}, f, indent=2, sort_keys=True)
+    return report
+
+
+def fetch(app, force=False):
+    """Download vendored files that are missing. Returns the paths written.
+
+    A download that doesn't match its pinned sha256 raises AssetError and
+    is not written.
+    """
+    written = []
+    for path, (url, _) in VENDOR.items():
+        target = os.path.join(app.static_folder, path)
+        if os.path.exists(target) and not force:
+            continue
+        with urllib.request.urlopen(url, timeout=30) as response:
+            data = response.read()
+        _check(path, data)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        _write(target, data)
+        written.append(path)
+    return written
+
+
+# Serving
+
+def load_manifest(app):
+    """Built files by bundle name, and whether they match the current inputs."""
+    path = os.path.join(app.static_folder, HASHED_DIR, MANIFEST)
+    try:
+        with open(path) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        logger.warning('No asset build found; serving untrimmed vendored files. Run `flask assets build`.')
+        return {}, False
+    fresh = manifest.get('inputs') == inputs_digest(app)
+    if not fresh:
+        logger.warning('Asset build is out of date; serving untrimmed vendored files. Run `flask assets build`.')
+    return manifest['files'], fresh
+
+
+def asset_url(name):
+    app = current_app._get_current_object()
+    state = app.extensions['assets']
+    if 'files' not in state:
+        state['files'], state['fresh'] = load_manifest(app)
+    files = state['files']
+
+    if name in files and state['fresh'] and not app.debug:
+        return url_for('static', filename=files[name])
+    bundle = BUNDLES[name]
+    linkable = os.path.splitext(bundle.source)[1] == os.path.splitext(name)[1]
+    if linkable and os.path.exists(os.path.join(app.static_folder, bundle.source)):
+        return url_for('static', filename=bundle.source)
+    # Generated bundles (icons.css) have no vendored equivalent; an older build beats none
+    if name in files:
+        return url_for('static', filename=files[name])
+    raise LookupError(f'{name} is neither built nor vendored; run `flask assets build`')
+
+
+def init_app(app):
+    app.extensions['assets'] = {}
+    app.add_template_global(asset_url)
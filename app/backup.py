@@ -0,0 +1,124 @@
+import logging
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+BACKUP_PREFIX = 'timetracker-'
+
+
+class BackupError(Exception):
+    pass
+
+
+def init_app(app):
+    app.config.setdefault('BACKUP_DIR', os.path.join(app.instance_path, 'backups'))
+    app.config.setdefault('BACKUP_KEEP', 7)              # generations to keep
+    app.config.setdefault('BACKUP_INTERVAL_HOURS', 24)   # 0 disables the scheduler
+    app.config.setdefault('BACKUP_PAGES_PER_STEP', 256)  # pages copied per lock hold
+    app.config.setdefault('BACKUP_STEP_SLEEP', 0.05)     # seconds between steps
+
+
+def database_path(app):
+    from . import db
+    with app.app_context():
+        url = db.engine.url
+    if url.get_backend_name() != 'sqlite' or not url.database or url.database == ':memory:':
+        raise BackupError('Online backup needs a file-based SQLite database')
+    return url.database
+
+
+def backup_database(app):
+    """Copy the live database into BACKUP_DIR and verify the copy.
+
+    Uses SQLite's online backup API a few pages at a time, so writers are
+    only held up for one short step at a time. Returns a dict with the
+    backup path, pages copied and duration.
+    """
+    source_path = database_path(app)
+    backup_dir = app.config['BACKUP_DIR']
+    os.makedirs(backup_dir, exist_ok=True)
+
+    name = f'{BACKUP_PREFIX}{datetime.now().strftime("%Y%m%d-%H%M%S")}.db'
+    target_path = os.path.join(backup_dir, name)
+    partial_path = target_path + '.partial'
+    pages = {'total': 0}
+
+    def progress(status, remaining, total):
+        pages['total'] = total
+
+    started = time.perf_counter()
+    source = sqlite3.connect(source_path, timeout=30)
+    target = sqlite3.connect(partial_path)
+    try:
+        source.backup(
+            target,
+            pages=app.config['BACKUP_PAGES_PER_STEP'],
+            progress=progress,
+            sleep=app.config['BACKUP_STEP_SLEEP']
+        )
+        result = target.execute('PRAGMA integrity_check').fetchone()[0]
+        if result != 'ok':
+            raise BackupError(f'Integrity check failed for {name}: {result}')
+    except Exception:
+        target.close()
+        os.remove(partial_path)
+        raise
+    finally:
+        source.close()
+    target.close()
+    os.replace(partial_path, target_path)
+
+    elapsed = time.perf_counter() - started
+    logger.info('Database backup %s: %d pages in %.2fs', target_path, pages['total'], elapsed)
+    rotate(backup_dir, app.config['BACKUP_KEEP'])
+    return {'path': target_path, 'pages': pages['total'], 'seconds': elapsed}
+
+
+def list_backups(backup_dir):
+    if not os.path.isdir(backup_dir):
+        return []
+    # Names embed the timestamp, so sorting them sorts by age
+    return sorted(
+        name for name in os.listdir(backup_dir)
+        if name.startswith(BACKUP_PREFIX) and name.endswith('.db')
+    )
+
+
+def rotate(backup_dir, keep):
+    backups = list_backups(backup_dir)
+    for name in backups[:-keep] if keep > 0 else []:
+        os.remove(os.path.join(backup_dir, name))
+        logger.info('Removed old database backup %s', name)
+
+
+def start_scheduler(app):
+    """Back up every BACKUP_INTERVAL_HOURS on a daemon thread. Returns the thread, or None if disabled."""
+    interval = float(app.config['BACKUP_INTERVAL_HOURS']) * 3600
+    if interval <= 0:
+        return None
+
+    def seconds_until_due():
+        backups = list_backups(app.config['BACKUP_DIR'])
+        if not backups:
+            return 60  # let the server finish starting first
+        newest = os.path.getmtime(os.path.join(app.config['BACKUP_DIR'], backups[-1]))
+        return max(0, interval - (time.time() - newest))
+
+    def run():
+        delay = seconds_until_due()
+        while True:
+            time.sleep(delay)
+            try:
+                backup_database(app)
+                delay = interval
+            except Exception:
+                logger.exception('Scheduled database backup failed')
+                delay = min(interval, 15 * 60)
+
+    thread = threading.Thread(target=run, name='db-backup', daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,121 @@
+import threading
+from collections import OrderedDict, namedtuple
+
+from sqlalchemy import select
+
+from .models import ProjectAssignment, User
+from .entries import holidays
+from . import db, versions
+
+# Widest window the capacity API computes in one go
+MAX_WINDOW_DAYS = 5 * 366
+CACHE_SIZE = 32
+
+# allocation is a users x days matrix of concurrent assignments; working
+# marks the weekdays that aren't HOLIDAYS.
+Capacity = namedtuple('Capacity', 'start end days working users allocation overlaps')
+CapacityUser = namedtuple('CapacityUser', 'id username utilization overbooked_days')
+Overlap = namedtuple('Overlap', 'user_id start end peak')
+
+# (start, end) -> (versions, Capacity), least recently used first. Entries
+# computed before an assignment or user write no longer match the versions.
+_cache = OrderedDict()
+_lock = threading.Lock()
+
+
+def assignment_rows(start, end):
+    return db.session.execute(
+        select(ProjectAssignment.user_id, ProjectAssignment.start_date, ProjectAssignment.end_date)
+        .where(ProjectAssignment.end_date >= start, ProjectAssignment.start_date <= end)
+    ).all()
+
+
+def compute(start, end):
+    """Expand the assignments overlapping [start, end] into a per-user, per-day allocation matrix.
+
+    Each assignment adds +1 on its first day and -1 after its last day in a
+    difference matrix; a cumulative sum along the days then gives how many
+    assignments every user holds on every day. Runs of days above 1 are
+    reported as overlaps.
+    """
+    # Only the capacity views need numpy; keep it off the startup path
+    import numpy as np
+
+    rows = assignment_rows(start, end)
+    origin = np.datetime64(start, 'D')
+    n_days = (end - start).days + 1
+    days = origin + np.arange(n_days)
+    working = np.is_busday(days, holidays=np.array(sorted(holidays()), dtype='datetime64[D]'))
+
+    user_ids = np.fromiter((row.user_id for row in rows), dtype=np.int64, count=len(rows))
+    starts = np.array([row.start_date for row in rows], dtype='datetime64[D]')
+    ends = np.array([row.end_date for row in rows], dtype='datetime64[D]')
+    users, user_index = np.unique(user_ids, return_inverse=True)
+
+    first = np.clip((starts - origin).astype(np.int64), 0, n_days)
+    after_last = np.clip((ends - origin).astype(np.int64) + 1, 0, n_days)
+    diff = np.zeros((len(users), n_days + 1), dtype=np.int32)
+    np.add.at(diff, (user_index, first), 1)
+    np.add.at(diff, (user_index, after_last), -1)
+    allocation = np.cumsum(diff[:, :-1], axis=1)
+
+    # Overlap runs: +1/-1 edges of the over-allocated mask, padded so runs
+    # touching the window edges are closed. nonzero() walks row by row, so
+    # the n-th start pairs with the n-th end.
+    over = np.zeros((len(users), n_days + 2), dtype=np.int8)
+    over[:, 1:-1] = allocation > 1
+    edges = np.diff(over, axis=1)
+    run_users, run_starts = np.nonzero(edges == 1)
+    _, run_ends = np.nonzero(edges == -1)
+    peaks = [allocation[u, s:e].max() for u, s, e in zip(run_users, run_starts, run_ends)]
+    overlaps = [
+        Overlap(int(users[u]), days[s].item(), days[e - 1].item(), int(peak))
+        for u, s, e, peak in zip(run_users, run_starts, run_ends, peaks)
+    ]
+
+    usernames = dict(db.session.execute(select(User.id, User.username).where(User.id.in_(users.tolist()))).all())
+    working_days = int(working.sum())
+    on_working = allocation[:, working]
+    utilization = on_working.sum(axis=1) / working_days if working_days else np.zeros(len(users))
+    overbooked = (on_working > 1).sum(axis=1)
+    capacity_users = [
+        CapacityUser(int(user_id), usernames.get(int(user_id)), float(utilization[i]), int(overbooked[i]))
+        for i, user_id in enumerate(users)
+    ]
+    return Capacity(start, end, days, working, capacity_users, allocation, overlaps)
+
+
+def get_capacity(start, end):
+    key = (start, end)
+    # Read before computing, so a racing write can only make the entry miss
+    state = versions.snapshot('assignments', 'users')
+    with _lock:
+        cached = _cache.get(key)
+        if cached and cached[0] == state:
+            _cache.move_to_end(key)
+            return cached[1]
+
+    capacity = compute(start, end)
+    with _lock:
+        _cache[key] = (state, capacity)
+        _cache.move_to_end(key)
+        while len(_cache) > CACHE_SIZE:
+            _cache.popitem(last=False)
+    return capacity
+
+
+def capacity_data(capacity):
+    return {
+        'from': capacity.start.isoformat(),
+        'to': capacity.end.isoformat(),
+        'days': capacity.days.astype(str).tolist(),
+        'working': capacity.working.tolist(),
+        'users': [
+            dict(user._asdict(), allocation=row)
+            for user, row in zip(capacity.users, capacity.allocation.tolist())
+        ],
+        'overlaps': [
+            {'user_id': o.user_id, 'start': o.start.isoformat(), 'end': o.end.isoformat(), 'peak': o.peak}
+            for o in capacity.overlaps
+        ]
+    }
@@ -0,0 +1,122 @@
+from datetime import date, timedelta
+
+import click
+from flask import current_app
+from flask.cli import AppGroup
+from sqlalchemy import text
+
+from . import assets, backup, db, dashboard, entries, export, rollup, timeline
+
+# Tables that must never be read with a full scan by the hot queries below.
+INDEXED_TABLES = ('time_entry', 'project_assignment', 'daily_hours')
+
+
+def hot_queries():
+    today = date.today()
+    year_ago = today - timedelta(days=365)
+
+    return {
+        'dashboard summary': dashboard.summary_query(1, today),
+        'dashboard assignments': dashboard.assignments_query(1, today),
+        'entry history page': entries.history_query(1, entries.encode_cursor(today, 1000)),
+        'timeline window': timeline.window_query(today - timedelta(days=7), today + timedelta(days=7)),
+        'export by user': export.export_query(year_ago, today, user_ids=[1, 2]),
+        'export by project': export.export_query(year_ago, today, project_ids=[1, 2]),
+        'export own entries': export.export_query(year_ago, today, restrict_to_user=1),
+    }
+
+
+def explain(statement):
+    sql = str(statement.compile(dialect=db.engine.dialect, compile_kwargs={'literal_binds': True}))
+    return [row[-1] for row in db.session.execute(text('EXPLAIN QUERY PLAN ' + sql))]
+
+
+def full_scans(plan):
+    # SQLite reports "SCAN <table>" for table scans and "SCAN <table> USING
+    # [COVERING] INDEX ..." for full index scans; both read every row.
+    return [step for step in plan
+            if step.startswith('SCAN ') and step.split()[1] in INDEXED_TABLES]
+
+
+def report_mismatches():
+    rows = rollup.mismatches()
+    for user_id, project_id, day, difference in rows[:20]:
+        click.echo(f'    user {user_id}, project {project_id}, {day}: off by {difference:+.2f}h')
+    if len(rows) > 20:
+        click.echo(f'    ... and {len(rows) - 20} more')
+    if rows:
+        raise click.ClickException(f'daily_hours disagrees with time_entry on {len(rows)} row(s)')
+    click.echo('daily_hours matches time_entry')
+
+
+rollup_cli = AppGroup('rollup', help='Maintain the daily_hours rollup table.')
+
+
+@rollup_cli.command('rebuild')
+def rollup_rebuild():
+    """Recompute daily_hours from time_entry and verify the result."""
+    count = rollup.rebuild()
+    click.echo(f'Rebuilt daily_hours: {count} row(s)')
+    report_mismatches()
+
+
+@rollup_cli.command('verify')
+def rollup_verify():
+    """Compare daily_hours against time_entry without changing anything."""
+    report_mismatches()
+
+
+assets_cli = AppGroup('assets', help='Vendored front-end libraries.')
+
+
+@assets_cli.command('build')
+def assets_build():
+    """Trim and fingerprint the vendored libraries into static/dist."""
+    try:
+        report = assets.build(current_app._get_current_object())
+    except assets.AssetError as e:
+        raise click.ClickException(str(e))
+    for name, (path, size_in, size_out) in report.items():
+        click.echo(f'{name}: {path} ({size_in // 1024} KB -> {size_out // 1024} KB)')
+
+
+@assets_cli.command('fetch')
+@click.option('--force', is_flag=True, help='Download files that are already vendored too.')
+def assets_fetch(force):
+    """Download the pinned upstream files into static/vendor."""
+    try:
+        written = assets.fetch(current_app._get_current_object(), force)
+    except assets.AssetError as e:
+        raise click.ClickException(str(e))
+    for path in written:
+        click.echo(f'Fetched {path}')
+    click.echo('Run `flask assets build` to update static/dist')
+
+
+def register_commands(app):
+    app.cli.add_command(rollup_cli)
+    app.cli.add_command(assets_cli)
+
+    @app.cli.command('backup')
+    def backup_command():
+        """Take an online backup of the database into BACKUP_DIR."""
+        try:
+            result = backup.backup_database(app)
+        except backup.BackupError as e:
+            raise click.ClickException(str(e))
+        click.echo(f"Backed up {result['pages']} pages to {result['path']} in {result['seconds']:.2f}s")
+
+    @app.cli.command('check-query-plans')
+    def check_query_plans():
+        """Fail if a hot dashboard/export query falls back to a table scan."""
+        failed = False
+        for name, statement in hot_queries().items():
+            plan = explain(statement)
+            scans = full_scans(plan)
+            status = 'SCAN' if scans else 'ok'
+            click.echo(f'{name}: {status}')
+            for step in plan:
+                click.echo(f'    {step}')
+            failed = failed or bool(scans)
+        if failed:
+            raise click.ClickException('One or more queries are not served by an index')
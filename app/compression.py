@@ -0,0 +1,93 @@
+import gzip
+import mimetypes
+import os
+
+from flask import request, send_from_directory
+from werkzeug.security import safe_join
+
+# Offered in this order when the client accepts both equally
+ENCODINGS = ('br', 'gzip')
+# Precompressed static files sit next to the original with these suffixes
+SUFFIXES = {'br': '.br', 'gzip': '.gz'}
+
+
+def load_brotli():
+    # Optional: without the Brotli package only gzip is offered
+    try:
+        import brotli
+    except ImportError:
+        return None
+    return brotli
+
+
+def etag_variants(tag):
+    """tag as sent for an identity body, then for each Content-Encoding."""
+    return (tag, *(f'{tag}-{encoding}' for encoding in ENCODINGS))
+
+
+def init_app(app):
+    # Bodies shorter than this many bytes are sent as they are
+    app.config.setdefault('COMPRESS_MIN_SIZE', 1024)
+    app.config.setdefault('COMPRESS_MIMETYPES', (
+        'text/html', 'application/json', 'text/css', 'text/javascript',
+        'application/javascript', 'image/svg+xml',
+    ))
+    app.config.setdefault('COMPRESS_GZIP_LEVEL', 6)
+    # 11 is far too slow for per-request use; 4-5 beats gzip -6 at similar cost
+    app.config.setdefault('COMPRESS_BROTLI_QUALITY', 4)
+
+    brotli = load_brotli()
+    compressors = {
+        'gzip': lambda data: gzip.compress(data, app.config['COMPRESS_GZIP_LEVEL'], mtime=0),
+    }
+    if brotli:
+        compressors['br'] = lambda data: brotli.compress(data, quality=app.config['COMPRESS_BROTLI_QUALITY'])
+    offered = [encoding for encoding in ENCODINGS if encoding in compressors]
+
+    @app.before_request
+    def serve_precompressed():
+        # `flask assets build` leaves .br/.gz siblings of the bundles it writes
+        if request.endpoint != 'static':
+            return None
+        filename = request.view_args['filename']
+        for encoding in ENCODINGS:
+            if not request.accept_encodings[encoding]:
+                continue
+            compressed = filename + SUFFIXES[encoding]
+            path = safe_join(app.static_folder, compressed)
+            if path and os.path.isfile(path):
+                response = send_from_directory(
+                    app.static_folder, compressed,
+                    mimetype=mimetypes.guess_type(filename)[0],
+                    max_age=app.get_send_file_max_age(filename)
+                )
+                response.headers['Content-Encoding'] = encoding
+                response.vary.add('Accept-Encoding')
+                return response
+        return None
+
+    @app.after_request
+    def compress(response):
+        if (response.status_code < 200 or response.status_code in (204, 206, 304)
+                or response.direct_passthrough or response.is_streamed
+                or 'Content-Encoding' in response.headers
+                or response.mimetype not in app.config['COMPRESS_MIMETYPES']
+                or 'no-transform' in response.headers.get('Cache-Control', '')):
+            return response
+
+        response.vary.add('Accept-Encoding')
+        data = response.get_data()
+        if len(data) < app.config['COMPRESS_MIN_SIZE']:
+            return response
+        encoding = request.accept_encodings.best_match(offered)
+        if encoding is None:
+            return response
+
+        response.set_data(compressors[encoding](data))
+        response.headers['Content-Encoding'] = encoding
+        # Each encoding is a different byte sequence, so it needs its own
+        # strong validator; see versions.conditional for the other side
+        tag, weak = response.get_etag()
+        if tag:
+            response.set_etag(f'{tag}-{encoding}', weak)
+        return response
@@ -0,0 +1,78 @@
+from collections import namedtuple
+from datetime import timedelta
+
+from sqlalchemy import and_, case, func, select
+
+from .models import Project, ProjectAssignment, DailyHours
+from . import db, versions
+
+ProjectHours = namedtuple('ProjectHours', 'name total_hours')
+AssignmentSummary = namedtuple('AssignmentSummary', 'project_name start_date end_date')
+Summary = namedtuple('Summary', 'weekly monthly current_month_hours assignments')
+
+# user_id -> ((day, versions) the summary was computed for, Summary). A
+# write to the user's entries, assignments or projects changes the versions.
+_cache = {}
+
+
+def summary_versions(user_id):
+    return versions.snapshot(*versions.entries_key(user_id), 'assignments', 'projects')
+
+
+def summary_window(today):
+    week_ago = today - timedelta(days=7)
+    month_ago = today - timedelta(days=30)
+    month_start = today.replace(day=1)
+    next_month = (month_start + timedelta(days=32)).replace(day=1)
+    return week_ago, month_ago, month_start, next_month
+
+
+def summary_query(user_id, today):
+    week_ago, month_ago, month_start, next_month = summary_window(today)
+
+    def hours_between(start, end):
+        # No ELSE branch: projects without hours in the window sum to NULL.
+        return func.sum(case((and_(DailyHours.day >= start, DailyHours.day <= end), DailyHours.hours)))
+
+    return select(
+        Project.name,
+        hours_between(week_ago, today).label('week_hours'),
+        hours_between(month_ago, today).label('month_hours'),
+        hours_between(month_start, next_month - timedelta(days=1)).label('current_month_hours')
+    ).join(DailyHours).where(
+        DailyHours.user_id == user_id,
+        DailyHours.day >= min(month_ago, month_start),
+        DailyHours.day < max(today + timedelta(days=1), next_month)
+    ).group_by(Project.name).order_by(Project.name)
+
+
+def assignments_query(user_id, today):
+    return select(
+        Project.name,
+        ProjectAssignment.start_date,
+        ProjectAssignment.end_date
+    ).join(Project).where(
+        ProjectAssignment.user_id == user_id,
+        ProjectAssignment.start_date <= today,
+        ProjectAssignment.end_date >= today
+    ).order_by(ProjectAssignment.start_date)
+
+
+def get_summary(user_id, today):
+    # Read the versions before querying: a write landing in between leaves
+    # the entry stale-looking, never stale.
+    state = (today, summary_versions(user_id))
+    cached = _cache.get(user_id)
+    if cached and cached[0] == state:
+        return cached[1]
+
+    rows = db.session.execute(summary_query(user_id, today)).all()
+    assignments = db.session.execute(assignments_query(user_id, today)).all()
+    summary = Summary(
+        weekly=[ProjectHours(row.name, row.week_hours) for row in rows if row.week_hours is not None],
+        monthly=[ProjectHours(row.name, row.month_hours) for row in rows if row.month_hours is not None],
+        current_month_hours=sum(row.current_month_hours or 0 for row in rows),
+        assignments=[AssignmentSummary(*row) for row in assignments]
+    )
+    _cache[user_id] = (state, summary)
+    return summary
@@ -0,0 +1,50 @@
+from sqlalchemy import event
+
+# Applied to every new SQLite connection. WAL lets readers keep going while a
+# writer commits; synchronous=NORMAL is durable across application crashes
+# in WAL mode and only risks the last commits on power loss.
+DEFAULT_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'busy_timeout': 5000,        # ms to wait for a lock before "database is locked"
+    'cache_size': -64000,        # negative means KiB, so 64 MB of page cache
+    'mmap_size': 256 * 1024 * 1024,
+    'temp_store': 'MEMORY',
+}
+
+# Config key -> SQLAlchemy create_engine() argument
+POOL_OPTIONS = {
+    'DB_POOL_SIZE': 'pool_size',
+    'DB_MAX_OVERFLOW': 'max_overflow',
+    'DB_POOL_TIMEOUT': 'pool_timeout',
+    'DB_POOL_RECYCLE': 'pool_recycle',
+}
+
+
+def engine_options(config):
+    """Build SQLALCHEMY_ENGINE_OPTIONS from the pool settings in config."""
+    options = dict(config.get('SQLALCHEMY_ENGINE_OPTIONS') or {})
+    for key, option in POOL_OPTIONS.items():
+        if config.get(key) is not None:
+            options.setdefault(option, config[key])
+
+    if config['SQLALCHEMY_DATABASE_URI'].startswith('sqlite'):
+        busy_timeout = config.get('SQLITE_PRAGMAS', {}).get('busy_timeout')
+        if busy_timeout is not None:
+            connect_args = dict(options.get('connect_args') or {})
+            # sqlite3's own lock timeout, in seconds
+            connect_args.setdefault('timeout', int(busy_timeout) / 1000)
+            options['connect_args'] = connect_args
+    return options
+
+
+def apply_pragmas(engine, pragmas):
+    if engine.dialect.name != 'sqlite' or not pragmas:
+        return
+
+    @event.listens_for(engine, 'connect')
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f'PRAGMA {name}={value}')
+        cursor.close()
@@ -0,0 +1,328 @@
+import math
+from collections import Counter, defaultdict
+from datetime import date, datetime, timedelta
+
+from flask import current_app
+from sqlalchemy import delete, insert, select, tuple_, update
+
+from .models import TimeEntry, Project
+from .rollup import apply_deltas, entry_rows, rollup_deltas
+from . import db
+
+MAX_HOURS_PER_ENTRY = 24
+# Entries per page of the history API
+PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+# Operations accepted by one apply_batch() call
+MAX_BATCH_SIZE = 500
+BATCH_OPS = ('create', 'update', 'delete')
+
+
+class EntryError(ValueError):
+    pass
+
+
+class BatchError(EntryError):
+    """Some operations of a batch were invalid; results says which."""
+
+    def __init__(self, message, results):
+        super().__init__(message)
+        self.results = results
+
+
+def holidays():
+    # HOLIDAYS may hold date objects or 'YYYY-MM-DD' strings
+    days = set()
+    for day in current_app.config.get('HOLIDAYS', ()):
+        if isinstance(day, str):
+            day = datetime.strptime(day, '%Y-%m-%d').date()
+        days.add(day)
+    return days
+
+
+def days_in_range(start_date, end_date, skip_non_working=False):
+    """List the dates from start_date to end_date inclusive.
+
+    With skip_non_working, weekends and the dates in the HOLIDAYS config
+    list are left out. Ranges longer than BULK_ENTRY_MAX_DAYS are refused.
+    """
+    if end_date < start_date:
+        raise EntryError('End date must not be before start date')
+    span = (end_date - start_date).days + 1
+    max_days = current_app.config.get('BULK_ENTRY_MAX_DAYS', 366)
+    if span > max_days:
+        raise EntryError(f'Date range is too long ({span} days, at most {max_days})')
+
+    days = [start_date + timedelta(days=offset) for offset in range(span)]
+    if skip_non_working:
+        skipped = holidays()
+        days = [day for day in days if day.weekday() < 5 and day not in skipped]
+    return days
+
+
+def clean_hours(value):
+    hours = float(value)
+    if math.isnan(hours) or not 0 < hours <= MAX_HOURS_PER_ENTRY:
+        raise EntryError(f'Hours must be between 0 and {MAX_HOURS_PER_ENTRY}')
+    return hours
+
+
+def active_projects(project_ids):
+    if not project_ids:
+        return set()
+    return set(db.session.scalars(
+        select(Project.id).where(Project.id.in_(project_ids), Project.is_active.is_(True))
+    ))
+
+
+def validate(rows):
+    """Check a batch of {'date', 'project_id', 'hours'} dicts before anything is written."""
+    if not rows:
+        raise EntryError('No entries to save')
+
+    cleaned = []
+    for row in rows:
+        try:
+            hours = clean_hours(row['hours'])
+            project_id = int(row['project_id'])
+        except EntryError:
+            raise
+        except (KeyError, TypeError, ValueError):
+            raise EntryError('Each entry needs a project and a number of hours')
+        cleaned.append({'date': row['date'], 'project_id': project_id, 'hours': hours})
+
+    project_ids = {row['project_id'] for row in cleaned}
+    if project_ids - active_projects(project_ids):
+        raise EntryError('Unknown or inactive project')
+    return cleaned
+
+
+def insert_entries(user_id, rows):
+    """Validate and insert a batch of entries for user_id in one transaction.
+
+    Uses a single executemany INSERT through Core instead of one ORM object
+    per row, and updates the daily_hours rollup in the same transaction.
+    Returns the number of rows inserted.
+    """
+    rows = [dict(row, user_id=user_id) for row in validate(rows)]
+    try:
+        db.session.execute(insert(TimeEntry), rows)
+        apply_deltas(rollup_deltas(
+            (row['user_id'], row['project_id'], row['date'], row['hours']) for row in rows
+        ))
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+    return len(rows)
+
+
+def write_entries(user_id, creates=(), updates=(), delete_ids=()):
+    """Write a batch of user_id's entries in the current transaction.
+
+    creates are {'date', 'project_id', 'hours'} dicts, updates are dicts
+    with an 'id' and the columns to set (all with the same keys) and
+    delete_ids are entry ids. Each kind goes out as one Core statement,
+    executemany for the updates, so the statement count doesn't grow with
+    the batch. Returns the ids of the created entries, in order.
+    """
+    # Names the user for versions.collect_bulk, which can't tell from an UPDATE or DELETE
+    options = {'entries_user_id': user_id}
+    ids = []
+    if creates:
+        # RETURNING order isn't guaranteed and asking for it makes SQLite
+        # insert row by row, so ids are matched back by value; rows with the
+        # same values are interchangeable
+        created = defaultdict(list)
+        for row in db.session.execute(
+            insert(TimeEntry).returning(TimeEntry.id, TimeEntry.date, TimeEntry.project_id, TimeEntry.hours),
+            [dict(row, user_id=user_id) for row in creates],
+            execution_options=options
+        ):
+            created[(row.date, row.project_id, row.hours)].append(row.id)
+        ids = [created[(row['date'], row['project_id'], row['hours'])].pop(0) for row in creates]
+    if updates:
+        db.session.execute(update(TimeEntry), list(updates), execution_options=options)
+    if delete_ids:
+        db.session.execute(
+            delete(TimeEntry).where(TimeEntry.user_id == user_id, TimeEntry.id.in_(delete_ids)),
+            execution_options=dict(options, synchronize_session=False)
+        )
+    return ids
+
+
+def _parse_operation(operation):
+    """Type-check one batch operation. Returns (op, id, changes) or raises EntryError."""
+    if not isinstance(operation, dict) or operation.get('op') not in BATCH_OPS:
+        raise EntryError(f"op must be one of {', '.join(BATCH_OPS)}")
+    op = operation['op']
+    entry_id = None
+    if op != 'create':
+        try:
+            entry_id = int(operation['id'])
+        except (KeyError, TypeError, ValueError):
+            raise EntryError('An entry id is required')
+        if op == 'delete':
+            return op, entry_id, {}
+
+    changes = {}
+    try:
+        if 'date' in operation:
+            changes['date'] = date.fromisoformat(operation['date'])
+        if 'project_id' in operation:
+            changes['project_id'] = int(operation['project_id'])
+        if 'hours' in operation:
+            changes['hours'] = clean_hours(operation['hours'])
+    except EntryError:
+        raise
+    except (TypeError, ValueError):
+        raise EntryError('Invalid date, project or hours')
+    if op == 'create' and len(changes) < 3:
+        raise EntryError('A new entry needs a date, a project and a number of hours')
+    if op == 'update' and not changes:
+        raise EntryError('Nothing to update')
+    return op, entry_id, changes
+
+
+def apply_batch(user_id, operations):
+    """Create, update and delete user_id's entries in one transaction.
+
+    operations is a list of {'op': 'create'|'update'|'delete', 'id', 'date',
+    'project_id', 'hours'} dicts; an update changes only the fields given.
+    Ownership of every referenced entry is checked with one query and new
+    projects with another. If any operation is invalid nothing is written
+    and BatchError carries the results; otherwise returns one result dict per
+    operation, in order, with the id of each created entry.
+    """
+    if not operations:
+        raise EntryError('No operations to apply')
+    if len(operations) > MAX_BATCH_SIZE:
+        raise EntryError(f'Too many operations ({len(operations)}, at most {MAX_BATCH_SIZE})')
+
+    results, parsed = [], []
+    for index, operation in enumerate(operations):
+        result = {'index': index, 'op': operation.get('op') if isinstance(operation, dict) else None,
+                  'status': 'ok'}
+        try:
+            op, entry_id, changes = _parse_operation(operation)
+            result['id'] = entry_id
+            parsed.append((result, op, entry_id, changes))
+        except EntryError as e:
+            result.update(status='error', message=str(e))
+        results.append(result)
+
+    repeated = {entry_id for entry_id, count in Counter(p[2] for p in parsed if p[2]).items() if count > 1}
+    owned = {}
+    ids = {entry_id for _, _, entry_id, _ in parsed if entry_id}
+    if ids:
+        owned = {entry.id: entry for entry in db.session.scalars(
+            select(TimeEntry).where(TimeEntry.id.in_(ids), TimeEntry.user_id == user_id)
+        )}
+    new_projects = {
+        changes['project_id'] for _, op, entry_id, changes in parsed
+        if 'project_id' in changes and (op == 'create' or entry_id not in owned
+                                        or owned[entry_id].project_id != changes['project_id'])
+    }
+    active = active_projects(new_projects)
+
+    for result, op, entry_id, changes in parsed:
+        if entry_id in repeated:
+            message = 'Entry appears more than once in the batch'
+        elif entry_id and entry_id not in owned:
+            # Other users' entries look the same as missing ones
+            message = 'Entry not found'
+        elif changes.get('project_id') in new_projects - active:
+            message = 'Unknown or inactive project'
+        else:
+            continue
+        result.update(status='error', message=message)
+
+    failed = sum(result['status'] == 'error' for result in results)
+    if failed:
+        for result in results:
+            if result['status'] == 'ok':
+                result['status'] = 'skipped'
+        raise BatchError(f'{failed} of {len(results)} operation(s) failed; nothing was saved', results)
+
+    deltas = defaultdict(float)
+    creates, updates, delete_ids = [], [], []
+    for result, op, entry_id, changes in parsed:
+        if op == 'create':
+            creates.append((result, changes))
+            rollup_deltas([(user_id, changes['project_id'], changes['date'], changes['hours'])], deltas=deltas)
+            continue
+        entry = owned[entry_id]
+        rollup_deltas(entry_rows([entry]), sign=-1, deltas=deltas)
+        if op == 'delete':
+            delete_ids.append(entry_id)
+            continue
+        # Every column, so all updates share one executemany
+        row = dict({'id': entry_id, 'date': entry.date, 'project_id': entry.project_id,
+                    'hours': entry.hours}, **changes)
+        updates.append(row)
+        rollup_deltas([(user_id, row['project_id'], row['date'], row['hours'])], deltas=deltas)
+
+    try:
+        ids = write_entries(user_id, [changes for _, changes in creates], updates, delete_ids)
+        for (result, _), entry_id in zip(creates, ids):
+            result['id'] = entry_id
+        apply_deltas(deltas)
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+    return results
+
+
+def encode_cursor(entry_date, entry_id):
+    return f'{entry_date.isoformat()}_{entry_id}'
+
+
+def decode_cursor(cursor):
+    try:
+        entry_date, entry_id = cursor.split('_')
+        return datetime.strptime(entry_date, '%Y-%m-%d').date(), int(entry_id)
+    except ValueError:
+        raise EntryError('Invalid cursor')
+
+
+def history_query(user_id, cursor=None, limit=PAGE_SIZE, project_ids=None, start_date=None, end_date=None):
+    """Newest-first page of user_id's entries after cursor.
+
+    Keyset pagination on (date, id): the cursor is the last row of the
+    previous page, so ix_time_entry_user_id_date seeks straight to it and
+    every page costs the same however deep it is. One extra row is fetched
+    to tell whether there is a next page.
+    """
+    query = select(
+        TimeEntry.id, TimeEntry.date, TimeEntry.project_id, Project.name, TimeEntry.hours
+    ).join(Project).where(TimeEntry.user_id == user_id)
+
+    if cursor:
+        query = query.where(tuple_(TimeEntry.date, TimeEntry.id) < tuple_(*decode_cursor(cursor)))
+    if project_ids:
+        query = query.where(TimeEntry.project_id.in_(project_ids))
+    if start_date:
+        query = query.where(TimeEntry.date >= start_date)
+    if end_date:
+        query = query.where(TimeEntry.date <= end_date)
+
+    return query.order_by(TimeEntry.date.desc(), TimeEntry.id.desc()).limit(limit + 1)
+
+
+def history_page(user_id, cursor=None, limit=PAGE_SIZE, project_ids=None, start_date=None, end_date=None):
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    rows = db.session.execute(
+        history_query(user_id, cursor, limit, project_ids, start_date, end_date)
+    ).all()
+    page = rows[:limit]
+    return {
+        'entries': [{
+            'id': row.id,
+            'date': row.date.isoformat(),
+            'project_id': row.project_id,
+            'project_name': row.name,
+            'hours': row.hours
+        } for row in page],
+        'next_cursor': encode_cursor(page[-1].date, page[-1].id) if len(rows) > limit else None
+    }
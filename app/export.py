@@ -0,0 +1,233 @@
+import csv
+import io
+import itertools
+import tempfile
+from collections import namedtuple
+from datetime import date, datetime
+
+from sqlalchemy import func, select
+
+from .models import TimeEntry, Project, User
+from . import db
+
+# Rows fetched from the cursor (and written to the sheet) per round.
+CHUNK_SIZE = 5000
+# Workbooks up to this size stay in memory; larger ones roll over to disk.
+SPOOL_MAX_SIZE = 8 * 1024 * 1024
+
+XLSX_MIMETYPE = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+# format -> (mimetype, file extension)
+FORMATS = {
+    'xlsx': (XLSX_MIMETYPE, 'xlsx'),
+    'csv': ('text/csv', 'csv'),
+    'parquet': ('application/vnd.apache.parquet', 'parquet'),
+}
+COLUMNS = ['Date', 'Project', 'User', 'Hours']
+
+# aggregate_by value -> grouping columns, in output order.
+AGGREGATES = {
+    'project': ['Project'],
+    'user': ['User'],
+    'project_user': ['Project', 'User'],
+}
+
+class ExportError(Exception):
+    pass
+
+
+# total_hours is None when the writer has to sum the rows itself.
+Report = namedtuple('Report', 'columns chunks total_hours')
+
+
+def _group_column(name):
+    return {'Project': Project.name, 'User': User.username}[name]
+
+
+def export_query(start_date, end_date, project_ids=None, user_ids=None, restrict_to_user=None,
+                 aggregate_by=None):
+    if aggregate_by:
+        keys = [_group_column(name) for name in AGGREGATES[aggregate_by]]
+        hours = func.sum(TimeEntry.hours)
+        # The window over the grouped sums gives the grand total on every
+        # row, so the summary line needs no second query.
+        query = select(*keys, hours, func.sum(hours).over())
+    else:
+        query = select(
+            TimeEntry.date,
+            Project.name,
+            User.username,
+            TimeEntry.hours
+        )
+
+    query = query.select_from(TimeEntry)\
+    .join(Project, TimeEntry.project_id == Project.id)\
+    .join(User, TimeEntry.user_id == User.id)\
+    .where(TimeEntry.date.between(start_date, end_date))
+
+    if restrict_to_user is not None:
+        query = query.where(TimeEntry.user_id == restrict_to_user)
+
+    if project_ids:
+        query = query.where(TimeEntry.project_id.in_(project_ids))
+
+    if user_ids:
+        query = query.where(TimeEntry.user_id.in_(user_ids))
+
+    if aggregate_by:
+        return query.group_by(*keys).order_by(*keys)
+    return query.order_by(TimeEntry.date, TimeEntry.id)
+
+
+def iter_chunks(query, chunk_size=CHUNK_SIZE):
+    # yield_per keeps the cursor open and hands back plain tuples, so rows
+    # are never hydrated into ORM objects or held all at once.
+    result = db.session.execute(query.execution_options(yield_per=chunk_size))
+    for partition in result.partitions():
+        yield partition
+
+
+def prepare_report(start_date, end_date, project_ids=None, user_ids=None, restrict_to_user=None,
+                   aggregate_by=None):
+    """Run the export query. Returns a Report, or None when nothing matches."""
+    if aggregate_by not in AGGREGATES:
+        aggregate_by = None
+    query = export_query(start_date, end_date, project_ids, user_ids, restrict_to_user, aggregate_by)
+
+    if aggregate_by:
+        rows = db.session.execute(query).all()
+        if not rows:
+            return None
+        return Report(AGGREGATES[aggregate_by] + ['Hours'], [[row[:-1] for row in rows]], rows[0][-1])
+
+    chunks = iter_chunks(query)
+    first_chunk = next(chunks, None)
+    if not first_chunk:
+        return None
+    return Report(COLUMNS, itertools.chain([first_chunk], chunks), None)
+
+
+def count_rows(start_date, end_date, project_ids=None, user_ids=None, restrict_to_user=None,
+               aggregate_by=None):
+    if aggregate_by not in AGGREGATES:
+        aggregate_by = None
+    query = export_query(start_date, end_date, project_ids, user_ids, restrict_to_user, aggregate_by)
+    return db.session.scalar(select(func.count()).select_from(query.order_by(None).subquery()))
+
+
+def no_data_message(user_ids=None):
+    # get user names from user ids from db
+    if user_ids:
+        users = User.query.filter(User.id.in_(user_ids)).all()
+        user_names = [user.username for user in users]
+        return f'No data found for the selected range and users: {", ".join(user_names)}'
+    return 'No data found for the selected range'
+
+
+def write_xlsx(fileobj, report, start_date, end_date, progress=None):
+    """Stream a report into a constant-memory workbook. Returns the row count.
+
+    progress, if given, is called with the running row count after each chunk.
+    """
+    import xlsxwriter
+
+    columns = report.columns
+    workbook = xlsxwriter.Workbook(fileobj, {'constant_memory': True})
+    worksheet = workbook.add_worksheet('Report')
+    # Same look as the header pandas.DataFrame.to_excel used to write.
+    header_format = workbook.add_format({'bold': True, 'border': 1, 'align': 'center', 'valign': 'top'})
+
+    worksheet.write_row(0, 0, columns, header_format)
+    hours_idx = columns.index('Hours')
+    meta_idx = hours_idx - 1 if hours_idx > 0 else 0
+
+    row_count = 0
+    total_hours = 0.0
+    for chunk in report.chunks:
+        for values in chunk:
+            row_count += 1
+            worksheet.write_row(row_count, 0, [
+                value.strftime('%Y-%m-%d') if isinstance(value, date) else value
+                for value in values
+            ])
+            total_hours += values[hours_idx]
+        if progress:
+            progress(row_count)
+    if report.total_hours is not None:
+        total_hours = report.total_hours
+
+    # One blank row, then the summary lines.
+    footer = row_count + 2
+    worksheet.write(footer, meta_idx, 'Total Hours')
+    worksheet.write(footer, hours_idx, total_hours)
+    worksheet.write(footer + 1, meta_idx, f'Export Range: {start_date} to {end_date}')
+    worksheet.write(footer + 2, meta_idx, f'Date Generated: {datetime.now().strftime("%Y-%m-%d")}')
+
+    workbook.close()
+    return row_count
+
+
+def iter_csv(report, progress=None):
+    """Yield the report as UTF-8 CSV, one encoded block per chunk.
+
+    CSV and Parquet carry only the data rows; the Total/Export Range lines
+    are a spreadsheet nicety that would break machine readers.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(report.columns)
+    row_count = 0
+    for chunk in report.chunks:
+        writer.writerows(chunk)
+        row_count += len(chunk)
+        yield buffer.getvalue().encode('utf-8')
+        buffer.seek(0)
+        buffer.truncate()
+        if progress:
+            progress(row_count)
+    if buffer.tell():
+        yield buffer.getvalue().encode('utf-8')
+
+
+def write_parquet(fileobj, report, progress=None):
+    """Write the report as Parquet, one row group per chunk. Returns the row count."""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ExportError('Parquet export requires the pyarrow package')
+
+    types = {
+        'Date': pa.date32(), 'Week': pa.date32(), 'Project': pa.string(), 'User': pa.string(),
+        'Hours': pa.float64(), 'Planned Days': pa.int64(), 'Planned Hours': pa.float64(),
+        'Variance': pa.float64(),
+    }
+    schema = pa.schema([(column, types[column]) for column in report.columns])
+
+    row_count = 0
+    with pq.ParquetWriter(fileobj, schema) as writer:
+        for chunk in report.chunks:
+            if not chunk:
+                continue
+            arrays = [pa.array(values, type=field.type) for values, field in zip(zip(*chunk), schema)]
+            writer.write_table(pa.Table.from_arrays(arrays, schema=schema), row_group_size=len(chunk))
+            row_count += len(chunk)
+            if progress:
+                progress(row_count)
+    return row_count
+
+
+def write_report(fileobj, report, fmt, start_date, end_date, progress=None):
+    if fmt == 'csv':
+        for block in iter_csv(report, progress):
+            fileobj.write(block)
+    elif fmt == 'parquet':
+        write_parquet(fileobj, report, progress)
+    else:
+        write_xlsx(fileobj, report, start_date, end_date, progress)
+
+
+def build_file(report, fmt, start_date, end_date):
+    output = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)
+    write_report(output, report, fmt, start_date, end_date)
+    output.seek(0)
+    return output
@@ -0,0 +1,72 @@
+import hashlib
+import os
+import threading
+
+from flask import request
+
+ONE_YEAR = 365 * 24 * 3600
+# Build output under static/ whose file names already carry a content hash
+HASHED_DIR = 'dist'
+
+
+class Fingerprints:
+    """Content hashes of static files, recomputed when a file's mtime changes."""
+
+    def __init__(self):
+        self.hashes = {}  # filename -> (mtime, digest)
+        self.lock = threading.Lock()
+
+    def get(self, folder, filename):
+        path = os.path.join(folder, filename)
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+        entry = self.hashes.get(filename)
+        if entry and entry[0] == mtime:
+            return entry[1]
+
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(65536), b''):
+                digest.update(chunk)
+        value = digest.hexdigest()[:12]
+        with self.lock:
+            self.hashes[filename] = (mtime, value)
+        return value
+
+
+fingerprints = Fingerprints()
+
+
+def init_app(app):
+    """Add ?v=<content hash> to url_for('static', ...) and let browsers keep those URLs for a year.
+
+    A changed file gets a new URL, so the long max-age never serves stale
+    content; a URL whose hash is out of date falls back to revalidation.
+    Files under HASHED_DIR are named by their hash and need no ?v=.
+    """
+
+    def is_hashed(filename):
+        return filename.startswith(HASHED_DIR + '/')
+
+    @app.url_defaults
+    def add_fingerprint(endpoint, values):
+        if (endpoint == 'static' and 'filename' in values and 'v' not in values
+                and not is_hashed(values['filename'])):
+            value = fingerprints.get(app.static_folder, values['filename'])
+            if value:
+                values['v'] = value
+
+    @app.after_request
+    def cache_fingerprinted(response):
+        if request.endpoint != 'static' or response.status_code not in (200, 304):
+            return response
+        filename = request.view_args.get('filename')
+        version = request.args.get('v')
+        if is_hashed(filename) or (version and version == fingerprints.get(app.static_folder, filename)):
+            response.cache_control.public = True
+            response.cache_control.max_age = ONE_YEAR
+            response.cache_control.immutable = True
+            response.cache_control.no_cache = None
+        return response
@@ -0,0 +1,89 @@
+import threading
+import time
+from collections import OrderedDict
+
+from flask_login import UserMixin
+
+from .models import User
+from . import db, versions
+
+
+class CachedUser(UserMixin):
+    """Detached snapshot of the User columns the request handlers read.
+
+    Session-bound ORM instances can't be shared between requests, so the
+    cache stores these plain objects instead.
+    """
+
+    def __init__(self, user):
+        self.id = user.id
+        self.username = user.username
+        self.is_admin = bool(user.is_admin)
+        self._is_active = user.is_active is not False
+
+    @property
+    def is_active(self):
+        return self._is_active
+
+    def __repr__(self):
+        return f'<CachedUser {self.id} {self.username}>'
+
+
+class IdentityCache:
+    """Process-local user_id -> CachedUser map with a TTL.
+
+    IDENTITY_CACHE_SIZE only has to cover the user table. Entries are also
+    dropped once the 'users' version moves, so a deactivation committed in
+    another worker process applies on the next request; the TTL bounds
+    staleness for changes made outside the app.
+    """
+
+    def __init__(self, ttl=300, maxsize=1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, user_id):
+        now = time.monotonic()
+        version = versions.get('users')
+        with self.lock:
+            entry = self.entries.get(user_id)
+            if entry and entry[0] > now and entry[1] == version:
+                self.entries.move_to_end(user_id)
+                return entry[2]
+
+        user = db.session.get(User, user_id)
+        snapshot = CachedUser(user) if user else None
+        with self.lock:
+            self.entries[user_id] = (now + self.ttl, version, snapshot)
+            self.entries.move_to_end(user_id)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+        return snapshot
+
+    def invalidate(self, user_id):
+        with self.lock:
+            self.entries.pop(int(user_id), None)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+
+identity_cache = IdentityCache()
+
+
+def init_app(app, login_manager):
+    app.config.setdefault('IDENTITY_CACHE_TTL', 300)
+    app.config.setdefault('IDENTITY_CACHE_SIZE', 1024)
+    identity_cache.ttl = app.config['IDENTITY_CACHE_TTL']
+    identity_cache.maxsize = app.config['IDENTITY_CACHE_SIZE']
+
+    @login_manager.user_loader
+    def load_user(user_id):
+        user = identity_cache.get(int(user_id))
+        # Deactivated users are logged out on their next request
+        if user is None or not user.is_active:
+            return None
+        return user
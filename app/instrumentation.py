@@ -0,0 +1,235 @@
+import bisect
+import functools
+import hmac
+import logging
+import re
+import threading
+import time
+from collections import Counter
+
+from flask import Response, current_app, g, has_request_context, request
+from sqlalchemy import event
+
+from . import db
+
+# Histogram bucket upper bounds; +Inf is implied.
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+QUERY_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100)
+PROMETHEUS_MIMETYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+logger = logging.getLogger(__name__)
+
+# "IN (?, ?, ?)" and multi-row VALUES differ only in length; treat them as one shape
+_PARAM_LIST = re.compile(r'\(\s*\?(?:\s*,\s*\?)*\s*\)')
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+def query_count():
+    """Number of SQL statements issued so far by the current request."""
+    return g.get('query_count', 0)
+
+
+def query_budget(limit):
+    """Cap the SQL statements a view may issue; see QUERY_BUDGETS."""
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+            g.query_budget = limit
+            return view(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def statement_shape(statement):
+    return _PARAM_LIST.sub('(?)', ' '.join(statement.split()))
+
+
+def n_plus_one_suspects(threshold):
+    return [(shape, count) for shape, count in g.get('query_shapes', Counter()).items() if count >= threshold]
+
+
+def check_queries(endpoint):
+    """Report N+1 suspects and enforce the query budget for the current request."""
+    config = current_app.config
+    if config['QUERY_DEBUG']:
+        for shape, count in n_plus_one_suspects(config['N_PLUS_ONE_THRESHOLD']):
+            logger.warning('Possible N+1 in %s: %d x %s', endpoint, count, shape)
+
+    budget = config['QUERY_BUDGETS'].get(endpoint, g.get('query_budget'))
+    if budget is not None and query_count() > budget:
+        message = f'{endpoint} issued {query_count()} SQL statements, budget is {budget}'
+        # Fails the test under TESTING; a warning everywhere else
+        if config['TESTING']:
+            raise QueryBudgetExceeded(message)
+        logger.warning(message)
+
+
+class Histogram:
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+
+    def lines(self, name, labels):
+        cumulative = 0
+        for bound, count in zip((*self.buckets, '+Inf'), self.counts):
+            cumulative += count
+            yield f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}'
+        yield f'{name}_sum{{{labels}}} {self.sum}'
+        yield f'{name}_count{{{labels}}} {cumulative}'
+
+
+def _labels(**labels):
+    escaped = (
+        (key, str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n'))
+        for key, value in labels.items()
+    )
+    return ','.join(f'{key}="{value}"' for key, value in escaped)
+
+
+class Metrics:
+    """Process-local request metrics, rendered in Prometheus text format.
+
+    Recording a request is a few dict updates under one lock. Label values
+    are endpoint names, so the series count is bounded by the route table.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.requests = {}   # (endpoint, method, status) -> count
+        self.latency = {}    # (endpoint, method) -> Histogram
+        self.queries = {}    # endpoint -> Histogram
+
+    def started(self):
+        with self.lock:
+            self.in_flight += 1
+
+    def finished(self, endpoint, method, status, seconds, queries):
+        with self.lock:
+            self.in_flight -= 1
+            key = (endpoint, method, status)
+            self.requests[key] = self.requests.get(key, 0) + 1
+            if (endpoint, method) not in self.latency:
+                self.latency[(endpoint, method)] = Histogram(LATENCY_BUCKETS)
+            self.latency[(endpoint, method)].observe(seconds)
+            if endpoint not in self.queries:
+                self.queries[endpoint] = Histogram(QUERY_BUCKETS)
+            self.queries[endpoint].observe(queries)
+
+    def render(self):
+        with self.lock:
+            lines = [
+                '# HELP loom_http_requests_in_flight Requests currently being handled.',
+                '# TYPE loom_http_requests_in_flight gauge',
+                f'loom_http_requests_in_flight {self.in_flight}',
+                '# HELP loom_http_requests_total Requests handled, by endpoint, method and status.',
+                '# TYPE loom_http_requests_total counter',
+            ]
+            for (endpoint, method, status), count in sorted(self.requests.items()):
+                lines.append(f'loom_http_requests_total{{{_labels(endpoint=endpoint, method=method, status=status)}}} {count}')
+
+            lines += [
+                '# HELP loom_http_request_duration_seconds Request latency, by endpoint and method.',
+                '# TYPE loom_http_request_duration_seconds histogram',
+            ]
+            for (endpoint, method), histogram in sorted(self.latency.items()):
+                lines += histogram.lines('loom_http_request_duration_seconds', _labels(endpoint=endpoint, method=method))
+
+            lines += [
+                '# HELP loom_sql_statements_per_request SQL statements issued per request, by endpoint.',
+                '# TYPE loom_sql_statements_per_request histogram',
+            ]
+            for endpoint, histogram in sorted(self.queries.items()):
+                lines += histogram.lines('loom_sql_statements_per_request', _labels(endpoint=endpoint))
+        return '\n'.join(lines) + '\n'
+
+
+metrics = Metrics()
+
+
+def init_app(app):
+    # Set QUERY_COUNT_HEADER to add X-Query-Count to every response, e.g.
+    # to check that a route's hot path does not touch the database.
+    app.config.setdefault('QUERY_COUNT_HEADER', False)
+    # Blueprints whose requests are recorded for /metrics
+    app.config.setdefault('METRICS_BLUEPRINTS', ('main', 'auth'))
+    # If set, /metrics wants "Authorization: Bearer <METRICS_TOKEN>"
+    app.config.setdefault('METRICS_TOKEN', None)
+    # Statements slower than this many seconds are logged; None turns it off
+    app.config.setdefault('SLOW_QUERY_THRESHOLD', 0.5)
+    # Track statement shapes per request and log N+1 suspects (dev/test)
+    app.config.setdefault('QUERY_DEBUG', app.debug or app.testing)
+    app.config.setdefault('N_PLUS_ONE_THRESHOLD', 5)
+    # endpoint -> max statements per request, on top of @query_budget
+    app.config.setdefault('QUERY_BUDGETS', {})
+
+    with app.app_context():
+        engine = db.engine
+
+    @event.listens_for(engine, 'before_cursor_execute')
+    def count_query(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault('query_started', []).append(time.perf_counter())
+        if has_request_context():
+            g.query_count = g.get('query_count', 0) + 1
+            if app.config['QUERY_DEBUG']:
+                g.setdefault('query_shapes', Counter())[statement_shape(statement)] += 1
+
+    @event.listens_for(engine, 'after_cursor_execute')
+    def log_slow_query(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info['query_started'].pop()
+        threshold = app.config['SLOW_QUERY_THRESHOLD']
+        if threshold is not None and elapsed >= threshold:
+            source = request.endpoint if has_request_context() else threading.current_thread().name
+            logger.warning('Slow query (%.3fs) in %s: %s; parameters: %r',
+                           elapsed, source, ' '.join(statement.split()), parameters)
+
+    @event.listens_for(engine, 'handle_error')
+    def drop_failed_query(context):
+        # after_cursor_execute never runs for a statement that raised
+        if context.connection is not None and context.connection.info.get('query_started'):
+            context.connection.info['query_started'].pop()
+
+    @app.before_request
+    def start_timer():
+        if request.blueprint in app.config['METRICS_BLUEPRINTS']:
+            g.request_started = time.perf_counter()
+            metrics.started()
+
+    @app.after_request
+    def add_query_count_header(response):
+        g.response_status = response.status_code
+        if app.config['QUERY_COUNT_HEADER']:
+            response.headers['X-Query-Count'] = str(query_count())
+        if request.endpoint:
+            check_queries(request.endpoint)
+        return response
+
+    # Teardown runs after streamed bodies finish and after unhandled errors
+    @app.teardown_request
+    def record_request(exc):
+        started = g.pop('request_started', None)
+        if started is None:
+            return
+        metrics.finished(
+            request.endpoint,
+            request.method,
+            g.get('response_status', 500),
+            time.perf_counter() - started,
+            query_count()
+        )
+
+    def metrics_view():
+        token = app.config['METRICS_TOKEN']
+        if token and not hmac.compare_digest(request.headers.get('Authorization', ''), f'Bearer {token}'):
+            return Response('Unauthorized\n', status=401, mimetype='text/plain')
+        return Response(metrics.render(), content_type=PROMETHEUS_MIMETYPE)
+
+    app.add_url_rule('/metrics', 'metrics', metrics_view)
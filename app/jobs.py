@@ -0,0 +1,225 @@
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from . import export, versions
+
+logger = logging.getLogger(__name__)
+
+JOB_ID = re.compile(r'[0-9a-f]{32}')
+# Seconds between progress writes to a job's state file
+PROGRESS_INTERVAL = 1.0
+
+
+class QueueFull(Exception):
+    pass
+
+
+class ExportJobs:
+    """Runs exports on a small worker pool and keeps the files on disk.
+
+    Finished files live in EXPORT_CACHE_DIR under a key derived from the
+    export filters and the versions of the data they read, so the same
+    export requested again within EXPORT_CACHE_TTL seconds is served from
+    the existing file until an entry, project or user changes. Each job's
+    state is mirrored to <job id>.json next to them, so a worker process
+    that didn't run the job can still report on it and serve the file.
+    """
+
+    def __init__(self):
+        self.app = None
+        self.executor = None
+        self.jobs = {}
+        self.lock = threading.Lock()
+
+    def init_app(self, app):
+        app.config.setdefault('EXPORT_WORKERS', 2)
+        app.config.setdefault('EXPORT_QUEUE_LIMIT', 8)
+        app.config.setdefault('EXPORT_CACHE_TTL', 15 * 60)
+        app.config.setdefault('EXPORT_CACHE_DIR', os.path.join(app.instance_path, 'exports'))
+        os.makedirs(app.config['EXPORT_CACHE_DIR'], exist_ok=True)
+
+        self.app = app
+        self.executor = ThreadPoolExecutor(
+            max_workers=app.config['EXPORT_WORKERS'],
+            thread_name_prefix='export'
+        )
+
+    @staticmethod
+    def data_versions(params):
+        # An export restricted to one user only reads that user's entries
+        user_id = params.get('restrict_to_user')
+        entries = versions.entries_key(user_id) if user_id is not None else (versions.ALL_ENTRIES,)
+        return versions.snapshot(*entries, 'projects', 'users')
+
+    @classmethod
+    def cache_key(cls, params, fmt):
+        # Read before the file is built, so a racing write can only make it miss
+        normalized = dict(params, format=fmt, versions=cls.data_versions(params))
+        normalized['project_ids'] = sorted(str(i) for i in params.get('project_ids') or [])
+        normalized['user_ids'] = sorted(str(i) for i in params.get('user_ids') or [])
+        blob = json.dumps(normalized, sort_keys=True, default=str)
+        return hashlib.sha256(blob.encode('utf-8')).hexdigest()[:32]
+
+    def cache_path(self, key, fmt):
+        extension = export.FORMATS[fmt][1]
+        return os.path.join(self.app.config['EXPORT_CACHE_DIR'], f'{key}.{extension}')
+
+    def state_path(self, job_id):
+        return os.path.join(self.app.config['EXPORT_CACHE_DIR'], f'{job_id}.json')
+
+    def _save(self, job):
+        path = self.state_path(job['id'])
+        tmp_path = f'{path}.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(job, f)
+        os.replace(tmp_path, path)
+
+    def _load(self, job_id):
+        if not JOB_ID.fullmatch(job_id):
+            return None
+        try:
+            with open(self.state_path(job_id)) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _is_fresh(self, path):
+        try:
+            return time.time() - os.path.getmtime(path) < self.app.config['EXPORT_CACHE_TTL']
+        except OSError:
+            return False
+
+    def evict(self):
+        ttl = self.app.config['EXPORT_CACHE_TTL']
+        now = time.time()
+        cache_dir = self.app.config['EXPORT_CACHE_DIR']
+        for name in os.listdir(cache_dir):
+            path = os.path.join(cache_dir, name)
+            try:
+                if now - os.path.getmtime(path) >= ttl:
+                    os.remove(path)
+            except OSError:
+                pass
+        with self.lock:
+            for job_id, job in list(self.jobs.items()):
+                if job['state'] in ('done', 'error') and now - job['created'] >= ttl:
+                    del self.jobs[job_id]
+
+    def submit(self, owner_id, params, fmt='xlsx'):
+        """Queue an export for owner_id and return the job dict."""
+        self.evict()
+        key = self.cache_key(params, fmt)
+        path = self.cache_path(key, fmt)
+
+        with self.lock:
+            # Someone is already building this exact file: share that job.
+            for job in self.jobs.values():
+                if job['key'] == key and job['owner_id'] == owner_id and job['state'] in ('queued', 'running'):
+                    return job
+
+            job = {
+                'id': uuid.uuid4().hex,
+                'key': key,
+                'owner_id': owner_id,
+                'format': fmt,
+                'state': 'queued',
+                'rows_written': 0,
+                'total_rows': None,
+                'message': None,
+                'path': path,
+                'created': time.time(),
+            }
+
+            if self._is_fresh(path):
+                job['state'] = 'done'
+                job['cached'] = True
+                self.jobs[job['id']] = job
+                self._save(job)
+                return job
+
+            pending = sum(1 for j in self.jobs.values() if j['state'] in ('queued', 'running'))
+            if pending >= self.app.config['EXPORT_QUEUE_LIMIT']:
+                raise QueueFull('Too many exports are running, please try again shortly')
+
+            self.jobs[job['id']] = job
+            self._save(job)
+
+        self.executor.submit(self._run, job, params)
+        return job
+
+    def get(self, job_id, owner_id):
+        job = self.jobs.get(job_id) or self._load(job_id)
+        if job is None or job['owner_id'] != owner_id:
+            return None
+        return job
+
+    def _run(self, job, params):
+        job['state'] = 'running'
+        self._save(job)
+        started = time.perf_counter()
+        saved = started
+        tmp_path = f"{job['path']}.{job['id']}.tmp"
+        try:
+            with self.app.app_context():
+                job['total_rows'] = export.count_rows(**params)
+                report = export.prepare_report(**params)
+                if report is None:
+                    job['message'] = export.no_data_message(params.get('user_ids'))
+                    job['state'] = 'error'
+                    return
+
+                def progress(rows_written):
+                    nonlocal saved
+                    job['rows_written'] = rows_written
+                    if time.perf_counter() - saved >= PROGRESS_INTERVAL:
+                        self._save(job)
+                        saved = time.perf_counter()
+
+                with open(tmp_path, 'wb') as output:
+                    export.write_report(output, report, job['format'],
+                                        params['start_date'], params['end_date'], progress)
+            os.replace(tmp_path, job['path'])
+            job['state'] = 'done'
+            logger.info('Export %s finished: %s rows in %.2fs',
+                        job['id'], job['rows_written'], time.perf_counter() - started)
+        except export.ExportError as e:
+            job['message'] = str(e)
+            job['state'] = 'error'
+        except Exception:
+            logger.exception('Export %s failed', job['id'])
+            job['message'] = 'Export failed'
+            job['state'] = 'error'
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            self._save(job)
+
+
+export_jobs = ExportJobs()
+
+
+def job_status(job):
+    total = job['total_rows']
+    if job['state'] == 'done':
+        progress = 1.0
+    elif total:
+        progress = min(job['rows_written'] / total, 1.0)
+    else:
+        progress = 0.0
+    return {
+        'id': job['id'],
+        'state': job['state'],
+        'format': job['format'],
+        'rows_written': job['rows_written'],
+        'total_rows': total,
+        'progress': round(progress, 3),
+        'message': job['message'],
+        'cached': job.get('cached', False),
+    }
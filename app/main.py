@@ -1,21 +1,36 @@
 # app/main.py
-from flask import Blueprint, flash, redirect, render_template, request, jsonify, send_file, url_for
+from flask import Blueprint, Response, flash, redirect, render_template, request, jsonify, send_file, stream_with_context, url_for
 from flask_login import login_required, current_user
-from datetime import datetime, timedelta
-import pandas as pd
-from io import BytesIO
+from datetime import date, datetime, timedelta
+import os
 from werkzeug.security import generate_password_hash
 
-from sqlalchemy import extract, func
 from .models import TimeEntry, Project, User, ProjectAssignment
-from . import db
+from .rollup import apply_deltas, entry_rows, rollup_deltas
+from .identity import identity_cache
+from .instrumentation import query_budget
+from .jobs import QueueFull, export_jobs, job_status
+from . import db, capacity, dashboard, entries, export, timeline, timesheet, variance, versions
 
 main = Blueprint('main', __name__)
 
+# What a conditional GET depends on besides the version counters
+def viewer():
+    return current_user.id, current_user.is_admin
+
+def viewer_and_args():
+    return (*viewer(), request.query_string)
+
+def viewer_entries():
+    return (*viewer(), versions.snapshot(*versions.entries_key(current_user.id)))
+
 # In app/main.py, modify the index route:
 
 @main.route('/')
 @login_required
+@versions.conditional('projects', 'users', 'assignments',
+                      extra=lambda: (*viewer_entries(), datetime.now().date()))
+@query_budget(6)
 def index():
     if current_user.is_admin:
         projects = Project.query.all()
@@ -28,50 +43,18 @@ def index():
     week_ago = today - timedelta(days=7)
     month_ago = today - timedelta(days=30)
 
-    # Weekly summary
-    weekly_entries = db.session.query(
-        Project.name,
-        func.sum(TimeEntry.hours).label('total_hours')
-    ).join(TimeEntry)\
-    .filter(
-        TimeEntry.user_id == current_user.id,
-        TimeEntry.date >= week_ago,
-        TimeEntry.date <= today
-    ).group_by(Project.name).all()
-
-    # Monthly summary
-    monthly_entries = db.session.query(
-        Project.name,
-        func.sum(TimeEntry.hours).label('total_hours')
-    ).join(TimeEntry)\
-    .filter(
-        TimeEntry.user_id == current_user.id,
-        TimeEntry.date >= month_ago,
-        TimeEntry.date <= today
-    ).group_by(Project.name).all()
-
-    current_month_hours = TimeEntry.query \
-        .filter(TimeEntry.user_id == current_user.id) \
-        .filter(extract('month', TimeEntry.date) == datetime.now().month) \
-        .with_entities(func.sum(TimeEntry.hours)) \
-        .scalar() or 0
-    
-    # Filter active assignments
-    today = datetime.now().date()
-    user_assignments = ProjectAssignment.query\
-        .filter_by(user_id=current_user.id)\
-        .filter(ProjectAssignment.start_date <= today)\
-        .filter(ProjectAssignment.end_date >= today)\
-        .all()
+    # Weekly/monthly/current-month totals come from one aggregation over
+    # daily_hours and are cached per user until their entries change.
+    summary = dashboard.get_summary(current_user.id, today)
 
     return render_template(
         'index.html',
         projects=projects,
         users=users,
-        current_month_hours=current_month_hours,
-        user_assignments=user_assignments,
-        weekly_summary=weekly_entries,
-        monthly_summary=monthly_entries,
+        current_month_hours=summary.current_month_hours,
+        user_assignments=summary.assignments,
+        weekly_summary=summary.weekly,
+        monthly_summary=summary.monthly,
         week_ago=week_ago,
         month_ago=month_ago,
         today=today
@@ -82,108 +65,163 @@ def index():
 def add_entry():
     data = request.json
     date = datetime.strptime(data['date'], '%Y-%m-%d').date()
-    
-    for entry in data['entries']:
-        new_entry = TimeEntry(
-            date=date,
-            hours=float(entry['hours']),
-            project_id=int(entry['project_id']),
-            user_id=current_user.id
-        )
-        db.session.add(new_entry)
-    
-    db.session.commit()
+
+    try:
+        entries.insert_entries(current_user.id, [
+            {'date': date, 'project_id': entry.get('project_id'), 'hours': entry.get('hours')}
+            for entry in data['entries']
+        ])
+    except entries.EntryError as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 400
+
     return jsonify({'status': 'success'})
 
+def export_params(data):
+    return {
+        'start_date': datetime.strptime(data['start_date'], '%Y-%m-%d').date(),
+        'end_date': datetime.strptime(data['end_date'], '%Y-%m-%d').date(),
+        'project_ids': data.get('projects'),
+        'user_ids': data.get('users'),
+        'restrict_to_user': None if current_user.is_admin else current_user.id,
+        'aggregate_by': data.get('aggregate_by') or None,
+    }
+
+def export_format(data):
+    fmt = data.get('format') or 'xlsx'
+    if fmt not in export.FORMATS:
+        raise ValueError(f'Unsupported export format: {fmt}')
+    return fmt
+
+def export_filename(fmt='xlsx', prefix='time_report'):
+    extension = export.FORMATS[fmt][1]
+    return f'{prefix}_{datetime.now().strftime("%Y%m%d")}.{extension}'
+
+def send_report(report, fmt, start_date, end_date, prefix='time_report'):
+    mimetype = export.FORMATS[fmt][0]
+    filename = export_filename(fmt, prefix)
+
+    # CSV goes out chunk by chunk while the cursor is still being read
+    if fmt == 'csv':
+        return Response(
+            stream_with_context(export.iter_csv(report)),
+            mimetype=mimetype,
+            headers={'Content-Disposition': f'attachment; filename={filename}'}
+        )
+
+    try:
+        output = export.build_file(report, fmt, start_date, end_date)
+    except export.ExportError as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 400
+
+    return send_file(
+        output,
+        mimetype=mimetype,
+        as_attachment=True,
+        download_name=filename
+    )
+
 @main.route('/export', methods=['POST'])
 @login_required
+@query_budget(4)
 def export_data():
     data = request.json
-    start_date = datetime.strptime(data['start_date'], '%Y-%m-%d').date()
-    end_date = datetime.strptime(data['end_date'], '%Y-%m-%d').date()
-    
-    query = TimeEntry.query.join(Project).join(User).filter(
-        TimeEntry.date.between(start_date, end_date)
-    )
-    
-    if not current_user.is_admin:
-        query = query.filter(TimeEntry.user_id == current_user.id)
-    
-    if data.get('projects'):
-        query = query.filter(Project.id.in_(data['projects']))
-    
-    if data.get('users'):
-        query = query.filter(User.id.in_(data['users']))
-    
-    entries = query.all()
-    
-    df = pd.DataFrame([{
-        'Date': entry.date.strftime('%Y-%m-%d') if hasattr(entry, 'date') else '',
-        'Project': entry.project.name if hasattr(entry.project, 'name') else '',
-        'User': entry.user.username if hasattr(entry.user, 'username') else '',
-        'Hours': entry.hours
-    } for entry in entries])
-
-    # Check if the DataFrame is empty
-    if df.empty:
-        # get user names from user ids from db 
-        if data.get('users'):
-            users = User.query.filter(User.id.in_(data['users'])).all()
-            user_names = [user.username for user in users]
-            error_message = f'No data found for the selected range and users: {", ".join(user_names)}'
-        else:
-            error_message = 'No data found for the selected range'
+    try:
+        fmt = export_format(data)
+    except ValueError as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 400
+
+    params = export_params(data)
+    report = export.prepare_report(**params)
+
+    # Check if there is any data
+    if report is None:
         return jsonify({
             'status': 'error', 
-            'message': error_message
+            'message': export.no_data_message(params['user_ids'])
             }), 404
-        
-    # Sort by date if 'Date' column exists
-    if 'Date' in df.columns:
-        df = df.sort_values('Date')
-    
-    # Aggregate data if requested
-    aggregate_by = data.get('aggregate_by')
-    if aggregate_by == 'project':
-        df = df.groupby(['Project']).agg({'Hours': 'sum'}).reset_index()
-    elif aggregate_by == 'user':
-        df = df.groupby(['User']).agg({'Hours': 'sum'}).reset_index()
-    elif aggregate_by == 'project_user':
-        df = df.groupby(['Project', 'User']).agg({'Hours': 'sum'}).reset_index()
-    
-    # Calculate total hours
-    total_hours = df['Hours'].sum()
-    
-    # Get list of columns and indices
-    columns = df.columns.tolist()
-    hours_idx = columns.index('Hours')
-    meta_idx = hours_idx - 1 if hours_idx > 0 else 0
 
-    empty_row = pd.DataFrame([{col: '' for col in columns}])
-    # Create empty rows with the same columns
-    summary_row = pd.DataFrame([{col: '' for col in columns}])
-    summary_row.iloc[0, meta_idx] = 'Total Hours'
-    summary_row.iloc[0, hours_idx] = total_hours
+    return send_report(report, fmt, params['start_date'], params['end_date'])
 
-    export_range_row = pd.DataFrame([{col: '' for col in columns}])
-    export_range_row.iloc[0, meta_idx] = f'Export Range: {start_date} to {end_date}'
+@main.route('/reports/variance', methods=['POST'])
+@login_required
+def variance_report():
+    """Planned vs actual hours per user, project and week.
 
-    date_generated_row = pd.DataFrame([{col: '' for col in columns}])
-    date_generated_row.iloc[0, meta_idx] = f'Date Generated: {datetime.now().strftime("%Y-%m-%d")}'
+    Returns JSON rows unless `format` names one of the export formats.
+    """
+    data = request.get_json()
+    try:
+        fmt = data.get('format') or 'json'
+        if fmt != 'json':
+            fmt = export_format(data)
+        params = export_params(data)
+    except (KeyError, TypeError, ValueError) as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 400
+    del params['aggregate_by']
+
+    report = variance.prepare_report(**params)
+    if report is None:
+        return jsonify({
+            'status': 'error',
+            'message': export.no_data_message(params['user_ids'])
+            }), 404
+
+    if fmt == 'json':
+        rows = [
+            dict(zip(report.columns, (value.isoformat() if isinstance(value, date) else value for value in row)))
+            for chunk in report.chunks for row in chunk
+        ]
+        return jsonify({'status': 'success', 'columns': report.columns, 'rows': rows})
+
+    return send_report(report, fmt, params['start_date'], params['end_date'], prefix='variance_report')
+
+# Background exports
+
+@main.route('/export/jobs', methods=['POST'])
+@login_required
+def start_export_job():
+    data = request.get_json()
+    try:
+        fmt = export_format(data)
+    except ValueError as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 400
+
+    try:
+        params = export_params(data)
+    except (KeyError, TypeError, ValueError):
+        return jsonify({'status': 'error', 'message': 'Invalid export parameters'}), 400
+
+    try:
+        job = export_jobs.submit(current_user.id, params, fmt)
+    except QueueFull as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 503
+
+    return jsonify({'status': 'success', 'job': job_status(job)}), 202
+
+@main.route('/export/jobs/<job_id>')
+@login_required
+def export_job_status(job_id):
+    job = export_jobs.get(job_id, current_user.id)
+    if job is None:
+        return jsonify({'status': 'error', 'message': 'Export not found'}), 404
+    return jsonify({'status': 'success', 'job': job_status(job)})
+
+@main.route('/export/jobs/<job_id>/download')
+@login_required
+def download_export_job(job_id):
+    job = export_jobs.get(job_id, current_user.id)
+    if job is None:
+        return jsonify({'status': 'error', 'message': 'Export not found'}), 404
+    if job['state'] != 'done':
+        return jsonify({'status': 'error', 'message': 'Export is not ready'}), 409
+    if not os.path.exists(job['path']):
+        return jsonify({'status': 'error', 'message': 'Export has expired, please run it again'}), 410
 
-    # Concatenate the DataFrames
-    df = pd.concat([df, empty_row, summary_row, export_range_row, date_generated_row], ignore_index=True)
-    
-    # Export to Excel
-    output = BytesIO()
-    with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
-        df.to_excel(writer, index=False, sheet_name='Report')
-    output.seek(0)
     return send_file(
-        output,
-        mimetype='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+        job['path'],
+        mimetype=export.FORMATS[job['format']][0],
         as_attachment=True,
-        download_name=f'time_report_{datetime.now().strftime("%Y%m%d")}.xlsx'
+        download_name=export_filename(job['format'])
     )
 
 @main.route('/add_user', methods=['GET', 'POST'])
@@ -272,20 +310,21 @@ def bulk_entry():
         end_date = datetime.strptime(request.form['end_date'], '%Y-%m-%d').date()
         project_id = request.form['project_id']
         total_hours = float(request.form['hours'])
-        hours_per_day = total_hours / ((end_date - start_date).days + 1)
-        
-        current_date = start_date
-        while current_date <= end_date:
-            new_entry = TimeEntry(
-                date=current_date,
-                hours=hours_per_day,
-                project_id=int(project_id),
-                user_id=current_user.id
-            )
-            db.session.add(new_entry)
-            current_date = current_date + timedelta(days=1)
-            
-        db.session.commit()
+        skip_non_working = request.form.get('skip_non_working') == 'on'
+
+        try:
+            days = entries.days_in_range(start_date, end_date, skip_non_working)
+            if not days:
+                raise entries.EntryError('No working days in the selected range')
+            hours_per_day = total_hours / len(days)
+            entries.insert_entries(current_user.id, [
+                {'date': day, 'project_id': project_id, 'hours': hours_per_day}
+                for day in days
+            ])
+        except entries.EntryError as e:
+            flash(str(e))
+            return redirect(url_for('main.bulk_entry'))
+
         flash('Bulk time entries added successfully')
         return redirect(url_for('main.index'))
         
@@ -308,6 +347,7 @@ def activate_user(user_id):
     user = User.query.get_or_404(user_id)
     user.is_active = True
     db.session.commit()
+    identity_cache.invalidate(user_id)
     flash(f'User {user.username} has been activated')
     return redirect(url_for('main.manage_users'))
 
@@ -322,11 +362,13 @@ def deactivate_user(user_id):
         return redirect(url_for('main.manage_users'))
     user.is_active = False
     db.session.commit()
+    identity_cache.invalidate(user_id)
     flash(f'User {user.username} has been deactivated')
     return redirect(url_for('main.manage_users'))
 
 @main.route('/manage_projects')
 @login_required
+@versions.conditional('projects', 'users', extra=viewer)
 def manage_projects():
     if not current_user.is_admin:
         return redirect(url_for('main.index'))
@@ -358,12 +400,13 @@ def deactivate_project(project_id):
 # Assignments
 @main.route('/admin/timeline')
 @login_required
+@versions.conditional('projects', 'users', extra=viewer)
+@query_budget(4)
 def admin_timeline():
     if not current_user.is_admin:
         return redirect(url_for('main.index'))
 
     projects = Project.query.filter_by(is_active=True).all()
-    assignments = ProjectAssignment.query.all()
     users = User.query.filter_by(is_active=True).all()
 
     # Convert projects to dictionaries
@@ -373,28 +416,62 @@ def admin_timeline():
         'deadline': project.deadline.isoformat() if project.deadline else None
     } for project in projects]
 
-    # Convert assignments to dictionaries
-    assignments_data = [{
-        'id': assignment.id,
-        'user_id': assignment.user_id,
-        'project_id': assignment.project_id,
-        'start_date': assignment.start_date.isoformat(),
-        'end_date': assignment.end_date.isoformat()
-    } for assignment in assignments]
-
     # Convert users to dictionaries
     users_data = [{
         'id': user.id,
         'username': user.username
     } for user in users]
 
+    # Assignments are fetched per visible window from list_assignments()
     return render_template(
         'admin_timeline.html',
         projects=projects_data,
-        assignments=assignments_data,
-        users=users_data
+        users=users_data,
+        max_window_days=timeline.MAX_WINDOW_DAYS
     )
 
+@main.route('/admin/assignments', methods=['GET'])
+@login_required
+@versions.conditional('assignments', extra=viewer_and_args)
+@query_budget(3)
+def list_assignments():
+    if not current_user.is_admin:
+        return jsonify({'error': 'Unauthorized'}), 403
+
+    try:
+        start, end = timeline.parse_window(request.args.get('from'), request.args.get('to'))
+    except timeline.WindowError as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 400
+
+    return jsonify({
+        'from': start.isoformat(),
+        'to': end.isoformat(),
+        'assignments': timeline.assignments_in_window(start, end)
+    })
+
+@main.route('/admin/capacity')
+@login_required
+def admin_capacity():
+    if not current_user.is_admin:
+        return redirect(url_for('main.index'))
+    return render_template('admin_capacity.html', max_window_days=capacity.MAX_WINDOW_DAYS)
+
+@main.route('/admin/capacity/data')
+@login_required
+@versions.conditional('assignments', 'users', extra=viewer_and_args)
+def capacity_data():
+    if not current_user.is_admin:
+        return jsonify({'error': 'Unauthorized'}), 403
+
+    try:
+        start, end = timeline.parse_window(
+            request.args.get('from'), request.args.get('to'), max_days=capacity.MAX_WINDOW_DAYS
+        )
+    except timeline.WindowError as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 400
+
+    return jsonify(capacity.capacity_data(capacity.get_capacity(start, end)))
+
 @main.route('/admin/assignments', methods=['POST'])
 @login_required
 def create_assignment():
@@ -418,13 +495,7 @@ def create_assignment():
 
     return jsonify({
         'status': 'success',
-        'assignment': {
-            'id': assignment.id,
-            'user_id': assignment.user_id,
-            'project_id': assignment.project_id,
-            'start_date': assignment.start_date.isoformat(),
-            'end_date': assignment.end_date.isoformat()
-        }
+        'assignment': timeline.assignment_data(assignment)
     })
 
 @main.route('/admin/assignments/update', methods=['POST'])
@@ -485,6 +556,7 @@ def toggle_admin():
         
     user.is_admin = make_admin
     db.session.commit()
+    identity_cache.invalidate(user_id)
 
     return jsonify({'status': 'success'})
 
@@ -492,17 +564,31 @@ def toggle_admin():
 
 @main.route('/my_entries')
 @login_required
+@query_budget(3)
 def my_entries():
-    # Get last 30 days entries
-    thirty_days_ago = datetime.now().date() - timedelta(days=30)
-    entries = TimeEntry.query\
-        .filter(TimeEntry.user_id == current_user.id)\
-        .filter(TimeEntry.date >= thirty_days_ago)\
-        .order_by(TimeEntry.date.desc())\
-        .all()
-        
+    # Entries are paged in by the template from entry_history()
     projects = Project.query.filter_by(is_active=True).all()
-    return render_template('my_entries.html', entries=entries, projects=projects)
+    return render_template('my_entries.html', projects=projects, page_size=entries.PAGE_SIZE)
+
+@main.route('/entries')
+@login_required
+@versions.conditional('projects', extra=lambda: (*viewer_entries(), request.query_string))
+@query_budget(3)
+def entry_history():
+    try:
+        start_date = request.args.get('from')
+        end_date = request.args.get('to')
+        page = entries.history_page(
+            current_user.id,
+            cursor=request.args.get('cursor'),
+            limit=request.args.get('limit', entries.PAGE_SIZE, type=int),
+            project_ids=request.args.getlist('project_id', type=int),
+            start_date=datetime.strptime(start_date, '%Y-%m-%d').date() if start_date else None,
+            end_date=datetime.strptime(end_date, '%Y-%m-%d').date() if end_date else None
+        )
+    except ValueError as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 400
+    return jsonify(dict(page, status='success'))
 
 @main.route('/update_entry', methods=['POST'])
 @login_required
@@ -513,8 +599,11 @@ def update_entry():
     if entry.user_id != current_user.id:
         return jsonify({'status': 'error', 'message': 'Unauthorized'}), 403
         
-    entry.project_id = data['project_id']
+    deltas = rollup_deltas(entry_rows([entry]), sign=-1)
+    entry.project_id = int(data['project_id'])
     entry.hours = float(data['hours'])
+    rollup_deltas(entry_rows([entry]), deltas=deltas)
+    apply_deltas(deltas)
     db.session.commit()
     return jsonify({'status': 'success'})
 
@@ -527,6 +616,66 @@ def delete_entry():
     if entry.user_id != current_user.id:
         return jsonify({'status': 'error', 'message': 'Unauthorized'}), 403
         
+    apply_deltas(rollup_deltas(entry_rows([entry]), sign=-1))
     db.session.delete(entry)
     db.session.commit()
-    return jsonify({'status': 'success'})
\ No newline at end of file
+    return jsonify({'status': 'success'})
+
+@main.route('/entries/batch', methods=['POST'])
+@login_required
+# Fixed however many operations: one ownership and one project lookup,
+# one INSERT, one executemany UPDATE and one DELETE, two for the rollup
+@query_budget(8)
+def batch_entries():
+    data = request.get_json(silent=True) or {}
+    operations = data.get('operations')
+    if not isinstance(operations, list):
+        return jsonify({'status': 'error', 'message': 'operations must be a list'}), 400
+
+    try:
+        results = entries.apply_batch(current_user.id, operations)
+    except entries.BatchError as e:
+        return jsonify({'status': 'error', 'message': str(e), 'results': e.results}), 400
+    except entries.EntryError as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 400
+    return jsonify({'status': 'success', 'results': results})
+
+# Weekly timesheet grid
+
+@main.route('/timesheet')
+@login_required
+def my_timesheet():
+    # The grid is loaded and saved by the template through the week API
+    return render_template('timesheet.html')
+
+@main.route('/timesheet/week')
+@login_required
+@versions.conditional('projects', extra=lambda: (*viewer_entries(), request.query_string, datetime.now().date()))
+@query_budget(2)
+def timesheet_week():
+    start = request.args.get('start')
+    try:
+        day = datetime.strptime(start, '%Y-%m-%d').date() if start else datetime.now().date()
+    except ValueError:
+        return jsonify({'status': 'error', 'message': 'start must be a date (YYYY-MM-DD)'}), 400
+    grid = timesheet.week_grid(current_user.id, timesheet.week_start(day))
+    return jsonify(dict(grid, status='success'))
+
+@main.route('/timesheet/week', methods=['POST'])
+@login_required
+# Project check, cell lookup, one INSERT, one executemany UPDATE and one
+# DELETE, two for the rollup
+@query_budget(8)
+def save_timesheet_week():
+    data = request.get_json(silent=True) or {}
+    cells = data.get('cells')
+    if not isinstance(cells, list):
+        return jsonify({'status': 'error', 'message': 'cells must be a list'}), 400
+
+    try:
+        results = timesheet.save_cells(current_user.id, cells)
+    except entries.BatchError as e:
+        return jsonify({'status': 'error', 'message': str(e), 'results': e.results}), 400
+    except entries.EntryError as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 400
+    return jsonify({'status': 'success', 'results': results})
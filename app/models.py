@@ -24,6 +24,11 @@ class TimeEntry(db.Model):
     user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
     project_id = db.Column(db.Integer, db.ForeignKey('project.id'), nullable=False)
 
+    __table_args__ = (
+        db.Index('ix_time_entry_user_id_date', 'user_id', 'date'),
+        db.Index('ix_time_entry_project_id_date', 'project_id', 'date'),
+    )
+
 class ProjectAssignment(db.Model):
     __tablename__ = 'project_assignment'
     id = db.Column(db.Integer, primary_key=True)
@@ -32,5 +37,23 @@ class ProjectAssignment(db.Model):
     start_date = db.Column(db.Date, nullable=False)
     end_date = db.Column(db.Date, nullable=False)
 
+    __table_args__ = (
+        db.Index('ix_project_assignment_user_id_start_date_end_date', 'user_id', 'start_date', 'end_date'),
+        db.Index('ix_project_assignment_end_date_start_date', 'end_date', 'start_date'),
+    )
+
     user = db.relationship('User', backref=db.backref('assignments', cascade='all, delete-orphan'))
-    project = db.relationship('Project', backref=db.backref('assignments', cascade='all, delete-orphan'))
\ No newline at end of file
+    project = db.relationship('Project', backref=db.backref('assignments', cascade='all, delete-orphan'))
+
+class DailyHours(db.Model):
+    # Per-user, per-project, per-day rollup of TimeEntry.hours, kept in step by
+    # app.rollup on every entry write.
+    __tablename__ = 'daily_hours'
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    project_id = db.Column(db.Integer, db.ForeignKey('project.id'), nullable=False)
+    day = db.Column(db.Date, nullable=False)
+    hours = db.Column(db.Float, nullable=False, default=0)
+
+    __table_args__ = (
+        db.PrimaryKeyConstraint('user_id', 'day', 'project_id'),
+    )
@@ -0,0 +1,103 @@
+import logging
+from collections import defaultdict
+
+from sqlalchemy import delete, func, insert, select, union_all
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from .models import TimeEntry, DailyHours
+from . import db, versions
+
+logger = logging.getLogger(__name__)
+
+# Float sums drift slightly when hours are added and removed again, so
+# anything closer to zero than this counts as an empty day.
+EPSILON = 1e-6
+
+
+def rollup_deltas(rows, sign=1, deltas=None):
+    """Accumulate (user_id, project_id, day, hours) rows into a delta map."""
+    if deltas is None:
+        deltas = defaultdict(float)
+    for user_id, project_id, day, hours in rows:
+        deltas[(int(user_id), int(project_id), day)] += sign * float(hours)
+    return deltas
+
+
+def entry_rows(entries):
+    return [(entry.user_id, entry.project_id, entry.date, entry.hours) for entry in entries]
+
+
+def apply_deltas(deltas):
+    """Apply a delta map to daily_hours in the current session transaction."""
+    rows = [
+        {'user_id': user_id, 'project_id': project_id, 'day': day, 'hours': hours}
+        for (user_id, project_id, day), hours in deltas.items()
+        if abs(hours) > EPSILON
+    ]
+    if not rows:
+        return
+
+    stmt = sqlite_insert(DailyHours)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=['user_id', 'day', 'project_id'],
+        set_={'hours': DailyHours.hours + stmt.excluded.hours}
+    )
+    db.session.execute(stmt, rows)
+
+    db.session.execute(
+        delete(DailyHours).where(
+            DailyHours.user_id.in_({row['user_id'] for row in rows}),
+            func.abs(DailyHours.hours) < EPSILON
+        )
+    )
+
+
+def rebuild():
+    """Recompute daily_hours from time_entry. Returns the number of rollup rows."""
+    db.session.execute(delete(DailyHours))
+    db.session.execute(
+        insert(DailyHours).from_select(
+            ['user_id', 'project_id', 'day', 'hours'],
+            select(TimeEntry.user_id, TimeEntry.project_id, TimeEntry.date, func.sum(TimeEntry.hours))
+            .group_by(TimeEntry.user_id, TimeEntry.project_id, TimeEntry.date)
+            .having(func.abs(func.sum(TimeEntry.hours)) >= EPSILON)
+        )
+    )
+    db.session.commit()
+    # daily_hours isn't tracked by the session listeners; the summaries of
+    # every user, in every process, read it
+    versions.bump('entries')
+    return db.session.scalar(select(func.count()).select_from(DailyHours))
+
+
+def backfill_if_empty():
+    """Rebuild daily_hours if it is empty while time_entry is not.
+
+    db.create_all() adds the table to an older database without the
+    migration's backfill, which would leave every dashboard at zero hours.
+    Returns the number of rollup rows written, or None if nothing was done.
+    """
+    if db.session.scalar(select(DailyHours.user_id).limit(1)) is not None:
+        return None
+    if db.session.scalar(select(TimeEntry.id).limit(1)) is None:
+        return None
+    count = rebuild()
+    logger.warning('daily_hours was empty but time_entry was not; rebuilt %d rollup row(s)', count)
+    return count
+
+
+def mismatches():
+    """Return (user_id, project_id, day, difference) for every rollup row that disagrees with time_entry."""
+    combined = union_all(
+        select(TimeEntry.user_id, TimeEntry.project_id, TimeEntry.date.label('day'),
+               TimeEntry.hours.label('hours')),
+        select(DailyHours.user_id, DailyHours.project_id, DailyHours.day,
+               (-DailyHours.hours).label('hours')),
+    ).subquery()
+    difference = func.sum(combined.c.hours)
+    return db.session.execute(
+        select(combined.c.user_id, combined.c.project_id, combined.c.day, difference.label('difference'))
+        .group_by(combined.c.user_id, combined.c.project_id, combined.c.day)
+        .having(func.abs(difference) >= EPSILON)
+        .order_by(combined.c.day)
+    ).all()
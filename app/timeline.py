@@ -0,0 +1,50 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import select
+
+from .models import ProjectAssignment
+from . import db
+
+# Widest window /admin/assignments serves; the timeline's zoomMax matches it.
+MAX_WINDOW_DAYS = 3 * 366
+
+
+class WindowError(ValueError):
+    pass
+
+
+def parse_window(start, end, max_days=MAX_WINDOW_DAYS):
+    try:
+        start = datetime.strptime(start or '', '%Y-%m-%d').date()
+        end = datetime.strptime(end or '', '%Y-%m-%d').date()
+    except ValueError:
+        raise WindowError('from and to must be dates (YYYY-MM-DD)')
+    if end < start:
+        raise WindowError('to must not be before from')
+    if end - start > timedelta(days=max_days):
+        raise WindowError(f'Window is limited to {max_days} days')
+    return start, end
+
+
+def window_query(start, end):
+    # Assignments overlapping [start, end]; the end_date range is served by
+    # ix_project_assignment_end_date_start_date.
+    return (
+        select(ProjectAssignment)
+        .where(ProjectAssignment.end_date >= start, ProjectAssignment.start_date <= end)
+        .order_by(ProjectAssignment.start_date, ProjectAssignment.id)
+    )
+
+
+def assignment_data(assignment):
+    return {
+        'id': assignment.id,
+        'user_id': assignment.user_id,
+        'project_id': assignment.project_id,
+        'start_date': assignment.start_date.isoformat(),
+        'end_date': assignment.end_date.isoformat()
+    }
+
+
+def assignments_in_window(start, end):
+    return [assignment_data(a) for a in db.session.scalars(window_query(start, end))]
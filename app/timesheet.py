@@ -0,0 +1,138 @@
+from collections import defaultdict
+from datetime import date, timedelta
+
+from sqlalchemy import and_, or_, select, tuple_
+
+from .entries import BatchError, EntryError, MAX_BATCH_SIZE, active_projects, clean_hours, write_entries
+from .models import DailyHours, Project, TimeEntry
+from .rollup import apply_deltas, entry_rows, rollup_deltas
+from . import db
+
+DAYS = 7
+
+
+def week_start(day):
+    """Monday of the week containing day."""
+    return day - timedelta(days=day.weekday())
+
+
+def grid_query(user_id, start):
+    # Active projects plus any inactive one with hours that week, with the
+    # user's daily_hours cells joined on: one seek on the rollup's primary key
+    end = start + timedelta(days=DAYS - 1)
+    return select(
+        Project.id, Project.name, Project.is_active, DailyHours.day, DailyHours.hours
+    ).outerjoin(DailyHours, and_(
+        DailyHours.project_id == Project.id,
+        DailyHours.user_id == user_id,
+        DailyHours.day.between(start, end)
+    )).where(
+        or_(Project.is_active.is_(True), DailyHours.day.is_not(None))
+    ).order_by(Project.name, Project.id)
+
+
+def week_grid(user_id, start):
+    """user_id's hours per project and day for the week starting on start (a Monday)."""
+    projects = {}
+    for row in db.session.execute(grid_query(user_id, start)):
+        project = projects.setdefault(row.id, {
+            'id': row.id, 'name': row.name, 'is_active': bool(row.is_active), 'hours': {}
+        })
+        if row.day is not None:
+            project['hours'][row.day.isoformat()] = round(row.hours, 2)
+    return {
+        'week_start': start.isoformat(),
+        'days': [(start + timedelta(days=offset)).isoformat() for offset in range(DAYS)],
+        'projects': list(projects.values()),
+    }
+
+
+def _parse_cell(cell):
+    try:
+        project_id = int(cell['project_id'])
+        day = date.fromisoformat(cell['date'])
+        hours = float(cell['hours'] or 0)
+    except (KeyError, TypeError, ValueError):
+        raise EntryError('Each cell needs a project, a date and a number of hours')
+    # 0 clears the cell
+    if hours:
+        hours = clean_hours(hours)
+    return project_id, day, hours
+
+
+def save_cells(user_id, cells):
+    """Set user_id's total hours for each (project, date) cell, in one transaction.
+
+    A cell's existing entries collapse into one: the first keeps its id and
+    takes the new total, the rest are deleted, and 0 deletes them all. Cells
+    without entries get a new one. Reads the affected entries with one query
+    and writes them with three, whatever the number of cells; raises
+    BatchError, having written nothing, if any cell is invalid. Returns the
+    saved cells.
+    """
+    if not cells:
+        raise EntryError('No cells to save')
+    if len(cells) > MAX_BATCH_SIZE:
+        raise EntryError(f'Too many cells ({len(cells)}, at most {MAX_BATCH_SIZE})')
+
+    results, parsed = [], {}
+    for index, cell in enumerate(cells):
+        result = {'index': index, 'status': 'ok'}
+        results.append(result)
+        try:
+            project_id, day, hours = _parse_cell(cell)
+        except EntryError as e:
+            result.update(status='error', message=str(e))
+            continue
+        result.update(project_id=project_id, date=day.isoformat(), hours=hours)
+        if (project_id, day) in parsed:
+            result.update(status='error', message='Cell appears more than once')
+            continue
+        parsed[(project_id, day)] = (result, hours)
+
+    # Hours can only be added on active projects; clearing works on any
+    active = active_projects({project_id for (project_id, _), (_, hours) in parsed.items() if hours})
+    for (project_id, _), (result, hours) in parsed.items():
+        if hours and project_id not in active:
+            result.update(status='error', message='Unknown or inactive project')
+
+    failed = sum(result['status'] == 'error' for result in results)
+    if failed:
+        for result in results:
+            if result['status'] == 'ok':
+                result['status'] = 'skipped'
+        raise BatchError(f'{failed} of {len(results)} cell(s) failed; nothing was saved', results)
+
+    existing = defaultdict(list)
+    for entry in db.session.scalars(
+        select(TimeEntry).where(
+            TimeEntry.user_id == user_id,
+            # The date range lets ix_time_entry_user_id_date seek instead of scanning the user's history
+            TimeEntry.date.between(min(day for _, day in parsed), max(day for _, day in parsed)),
+            tuple_(TimeEntry.project_id, TimeEntry.date).in_(list(parsed))
+        ).order_by(TimeEntry.id)
+    ):
+        existing[(entry.project_id, entry.date)].append(entry)
+
+    deltas = defaultdict(float)
+    creates, updates, delete_ids = [], [], []
+    for (project_id, day), (result, hours) in parsed.items():
+        entries = existing[(project_id, day)]
+        rollup_deltas(entry_rows(entries), sign=-1, deltas=deltas)
+        if hours and entries:
+            updates.append({'id': entries[0].id, 'hours': hours})
+            entries = entries[1:]
+        elif hours:
+            creates.append({'project_id': project_id, 'date': day, 'hours': hours})
+        delete_ids.extend(entry.id for entry in entries)
+        rollup_deltas([(user_id, project_id, day, hours)], deltas=deltas)
+
+    try:
+        # One INSERT, one executemany UPDATE and one DELETE whatever the number of cells
+        write_entries(user_id, creates, updates, delete_ids)
+        apply_deltas(deltas)
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+    return results
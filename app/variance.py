@@ -0,0 +1,126 @@
+from flask import current_app
+from sqlalchemy import func, select
+
+from .models import DailyHours, Project, ProjectAssignment, User
+from .entries import holidays
+from .export import Report
+from . import db
+
+COLUMNS = ['Week', 'User', 'Project', 'Planned Days', 'Planned Hours', 'Hours', 'Variance']
+
+
+def week_of(column):
+    # Monday of the column's week: forward to Sunday, then back six days
+    return func.date(column, 'weekday 0', '-6 days')
+
+
+def _filtered(query, user_column, project_column, project_ids, user_ids, restrict_to_user):
+    if restrict_to_user is not None:
+        query = query.where(user_column == restrict_to_user)
+    if project_ids:
+        query = query.where(project_column.in_(project_ids))
+    if user_ids:
+        query = query.where(user_column.in_(user_ids))
+    return query
+
+
+def actual_query(start_date, end_date, project_ids=None, user_ids=None, restrict_to_user=None):
+    week = week_of(DailyHours.day)
+    query = select(
+        DailyHours.user_id, DailyHours.project_id, week, func.sum(DailyHours.hours)
+    ).where(DailyHours.day.between(start_date, end_date))
+    query = _filtered(query, DailyHours.user_id, DailyHours.project_id, project_ids, user_ids, restrict_to_user)
+    return query.group_by(DailyHours.user_id, DailyHours.project_id, week)
+
+
+def planned_query(start_date, end_date, project_ids=None, user_ids=None, restrict_to_user=None):
+    query = select(
+        ProjectAssignment.user_id,
+        ProjectAssignment.project_id,
+        func.max(ProjectAssignment.start_date, start_date),
+        func.min(ProjectAssignment.end_date, end_date)
+    ).where(ProjectAssignment.end_date >= start_date, ProjectAssignment.start_date <= end_date)
+    return _filtered(query, ProjectAssignment.user_id, ProjectAssignment.project_id,
+                     project_ids, user_ids, restrict_to_user)
+
+
+def planned_weeks(rows):
+    """Split clipped assignments into (user_id, project_id, week, planned working days).
+
+    Every assignment is repeated once per week it touches; the working days
+    of each week's slice are then counted in one np.busday_count call.
+    """
+    import numpy as np
+    import pandas as pd
+
+    columns = ['user_id', 'project_id', 'start', 'end']
+    assignments = pd.DataFrame(rows, columns=columns)
+    starts = assignments['start'].to_numpy(dtype='datetime64[D]')
+    ends = assignments['end'].to_numpy(dtype='datetime64[D]')
+
+    # 1970-01-01 was a Thursday, so day number + 3 is days since Monday
+    first_monday = starts - (starts.astype(np.int64) + 3) % 7
+    last_monday = ends - (ends.astype(np.int64) + 3) % 7
+    n_weeks = ((last_monday - first_monday).astype(np.int64) // 7 + 1)
+
+    index = np.repeat(np.arange(len(assignments)), n_weeks)
+    week_number = np.arange(len(index)) - np.repeat(np.cumsum(n_weeks) - n_weeks, n_weeks)
+    weeks = first_monday[index] + 7 * week_number
+    slice_start = np.maximum(weeks, starts[index])
+    slice_end = np.minimum(weeks + 6, ends[index])
+    days = np.busday_count(
+        slice_start, slice_end + 1, holidays=np.array(sorted(holidays()), dtype='datetime64[D]')
+    )
+
+    return pd.DataFrame({
+        'user_id': assignments['user_id'].to_numpy()[index],
+        'project_id': assignments['project_id'].to_numpy()[index],
+        'week': weeks,
+        'planned_days': days,
+    }).groupby(['user_id', 'project_id', 'week'], as_index=False).sum()
+
+
+def prepare_report(start_date, end_date, project_ids=None, user_ids=None, restrict_to_user=None):
+    """Planned days (from assignments) against logged hours per user, project and week.
+
+    Returns an export Report, or None when there is neither a plan nor hours
+    in the range.
+    """
+    import pandas as pd
+
+    filters = (start_date, end_date, project_ids, user_ids, restrict_to_user)
+    planned_rows = db.session.execute(planned_query(*filters)).all()
+    actual_rows = db.session.execute(actual_query(*filters)).all()
+    if not planned_rows and not actual_rows:
+        return None
+
+    keys = ['user_id', 'project_id', 'week']
+    planned = planned_weeks(planned_rows)
+    actual = pd.DataFrame(actual_rows, columns=keys + ['hours'])
+    actual['week'] = pd.to_datetime(actual['week'])
+    report = planned.merge(actual, on=keys, how='outer').fillna({'planned_days': 0, 'hours': 0.0})
+    # Weekend-only assignment slices plan nothing and log nothing
+    report = report[(report['planned_days'] > 0) | (report['hours'] != 0)]
+    if report.empty:
+        return None
+
+    hours_per_day = current_app.config.get('PLANNED_HOURS_PER_DAY', 8)
+    report['planned_hours'] = report['planned_days'] * hours_per_day
+    report['variance'] = report['hours'] - report['planned_hours']
+
+    usernames = dict(db.session.execute(select(User.id, User.username)).all())
+    project_names = dict(db.session.execute(select(Project.id, Project.name)).all())
+    report['user'] = report['user_id'].map(usernames)
+    report['project'] = report['project_id'].map(project_names)
+    report = report.sort_values(['week', 'user', 'project'])
+
+    values = [
+        report['week'].dt.date.tolist(),
+        report['user'].tolist(),
+        report['project'].tolist(),
+        report['planned_days'].astype(int).tolist(),
+        report['planned_hours'].astype(float).tolist(),
+        report['hours'].astype(float).tolist(),
+        report['variance'].astype(float).tolist(),
+    ]
+    return Report(COLUMNS, [list(zip(*values))], float(report['hours'].sum()))
@@ -0,0 +1,198 @@
+"""Version counters for the data behind cached pages and payloads.
+
+Every committed write to users, projects, assignments or a user's time
+entries bumps the matching counter. Pages hash the counters they depend on
+into a strong ETag, so a conditional GET can answer 304 before touching the
+database, and in-process caches compare versions instead of being cleared
+by hand.
+
+Counters live in a memory-mapped file, instance/versions.bin by default
+(VERSIONS_FILE), so every process started from the same instance folder
+sees each other's bumps: forked server workers, a second server, and CLI
+commands such as `flask rollup rebuild`. Keys hash into a fixed number of
+slots; two keys sharing a slot only cost extra cache misses. A bump stores
+a fresh random value rather than an increment, one aligned 8-byte write,
+so processes need no shared lock and a slot never goes back to a value a
+reader has already seen. The token drawn at startup is part of every ETag,
+so a restart never yields a false 304.
+
+Limits: only writes made through the app's session (the ORM, or Core
+statements on mapped tables) bump counters. Writes from outside the app
+(the sqlite3 shell, another program, a restored backup) or raw text() SQL
+don't; bump() the affected keys after them, or restart the server. Before
+init_app() maps the file, counters are private to the process.
+"""
+import functools
+import hashlib
+import mmap
+import os
+import zlib
+
+from flask import Response, make_response, request, session
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from .compression import etag_variants
+from .models import Project, ProjectAssignment, TimeEntry, User
+
+SLOTS = 4096
+SIZE = SLOTS * 8
+
+_counters = memoryview(mmap.mmap(-1, SIZE)).cast('q')
+_token = os.urandom(8).hex()
+# Path -> counters mapped from it, so apps sharing a file share one map
+_maps = {}
+
+# Model -> counter key written for each flushed instance
+KEYS = {
+    User: lambda user: 'users',
+    Project: lambda project: 'projects',
+    ProjectAssignment: lambda assignment: 'assignments',
+    TimeEntry: lambda entry: ('entries', entry.user_id),
+}
+
+
+def _slot(key):
+    # Stable across processes, unlike hash() under PYTHONHASHSEED
+    return zlib.crc32(repr(key).encode()) % SLOTS
+
+
+def get(key):
+    return _counters[_slot(key)]
+
+
+def bump(*keys):
+    for slot in {_slot(key) for key in keys}:
+        # Non-negative, to fit the signed slot
+        _counters[slot] = int.from_bytes(os.urandom(8), 'little') >> 1
+
+
+def open_counters(path):
+    """Counters backed by the file at path, created (zero-filled) if missing."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'a+b') as f:
+        # Concurrent first starts may both extend it; to the same size
+        if os.fstat(f.fileno()).st_size < SIZE:
+            f.truncate(SIZE)
+        # The mapping outlives the file object
+        return memoryview(mmap.mmap(f.fileno(), SIZE)).cast('q')
+
+
+# Bumped along with any entries key, for readers spanning every user's entries
+ALL_ENTRIES = 'entries:all'
+
+
+def entries_key(user_id):
+    # Writes that can't be pinned to a user bump the plain 'entries' key
+    return ('entries', int(user_id)), 'entries'
+
+
+def snapshot(*keys):
+    """Current versions of keys, for caches to compare against later."""
+    return tuple(get(key) for key in keys)
+
+
+def etag(*keys, extra=()):
+    state = repr((_token, snapshot(*keys), tuple(extra)))
+    return hashlib.sha1(state.encode()).hexdigest()
+
+
+def conditional(*keys, extra=None):
+    """Serve the view with an ETag built from keys, and 304 when it still matches.
+
+    extra, if given, is called per request for anything else the response
+    depends on (the current user, today's date, query arguments). Responses
+    are skipped while flashed messages are pending, since those render
+    into the page once.
+    """
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+            if '_flashes' in session:
+                return view(*args, **kwargs)
+
+            tag = etag(*keys, extra=extra() if extra else ())
+            # A cached gzip or br body carries a suffixed tag for the same content
+            matched = next((t for t in etag_variants(tag) if request.if_none_match.contains(t)), None)
+            if matched:
+                response = Response(status=304)
+                response.set_etag(matched)
+            else:
+                response = make_response(view(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+                response.set_etag(tag)
+            # Per-user pages: browsers may keep them but must revalidate
+            response.headers['Cache-Control'] = 'private, no-cache'
+            return response
+        return wrapper
+    return decorator
+
+
+def _pending(session_):
+    return session_.info.setdefault('version_bumps', set())
+
+
+def collect(session_, flush_context):
+    pending = _pending(session_)
+    for instance in (*session_.new, *session_.dirty, *session_.deleted):
+        key = KEYS.get(type(instance))
+        if key:
+            pending.add(key(instance))
+
+
+def collect_bulk(state):
+    # Core-style insert(TimeEntry)/update()/delete() run through the session
+    if not (state.is_insert or state.is_update or state.is_delete) or not state.bind_mapper:
+        return
+    model = state.bind_mapper.class_
+    if model is TimeEntry:
+        if 'entries_user_id' in state.execution_options:
+            # Set by entries.write_entries, whose writes touch one user's entries only
+            user_ids = {state.execution_options['entries_user_id']}
+        elif state.is_insert:
+            params = state.parameters if isinstance(state.parameters, list) else [state.parameters or {}]
+            user_ids = {row.get('user_id') for row in params}
+        else:
+            user_ids = {None}
+        if None not in user_ids:
+            _pending(state.session).update(('entries', int(user_id)) for user_id in user_ids)
+        else:
+            _pending(state.session).add('entries')
+    elif model in KEYS:
+        _pending(state.session).add(KEYS[model](None))
+
+
+def apply(session_):
+    pending = session_.info.pop('version_bumps', None)
+    if pending:
+        if any(key == 'entries' or (isinstance(key, tuple) and key[0] == 'entries') for key in pending):
+            pending.add(ALL_ENTRIES)
+        bump(*pending)
+
+
+def discard(session_):
+    session_.info.pop('version_bumps', None)
+
+
+LISTENERS = [
+    ('after_flush', collect),
+    ('do_orm_execute', collect_bulk),
+    ('after_commit', apply),
+    ('after_rollback', discard),
+]
+
+
+def init_app(app):
+    global _counters
+    app.config.setdefault('VERSIONS_FILE', os.path.join(app.instance_path, 'versions.bin'))
+    path = os.path.abspath(app.config['VERSIONS_FILE'])
+    if path not in _maps:
+        _maps[path] = open_counters(path)
+    _counters = _maps[path]
+
+    # Keys are collected at flush and applied only after the commit, so a
+    # reader never pairs the new version with the old rows.
+    for name, listener in LISTENERS:
+        if not event.contains(Session, name, listener):
+            event.listen(Session, name, listener)
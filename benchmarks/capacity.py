@@ -0,0 +1,54 @@
+"""Time the capacity engine over years of assignments for a whole studio.
+
+Generates back-to-back assignments per user (some overlapping) and times
+capacity.compute() cold and capacity.get_capacity() once cached:
+
+    python -m benchmarks.capacity --users 100 --years 5
+"""
+import argparse
+import tempfile
+import time
+from datetime import timedelta
+
+from app import capacity, create_app, db
+from benchmarks.datagen import bench_config, generate
+
+
+def timed(func, *args):
+    started = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--users', type=int, default=100)
+    parser.add_argument('--projects', type=int, default=50)
+    parser.add_argument('--years', type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        app = create_app(bench_config(tmpdir))
+        with app.app_context():
+            dataset = generate(args.users, args.projects, args.years, entries_per_day=(0, 0))
+            start, end = dataset.start, dataset.end
+            print(f'{dataset.assignments} assignments, {args.users} users, {(end - start).days + 1} days')
+
+            # Window capped like the API would
+            start = max(start, end - timedelta(days=capacity.MAX_WINDOW_DAYS))
+            timed(capacity.compute, start, start + timedelta(days=7))  # warm numpy import
+            result, cold = timed(capacity.compute, start, end)
+            _, cached = timed(capacity.get_capacity, start, end)
+            _, hit = timed(capacity.get_capacity, start, end)
+            _, serialize = timed(capacity.capacity_data, result)
+            print(f'compute       {cold * 1000:8.1f} ms')
+            print(f'first get     {cached * 1000:8.1f} ms')
+            print(f'cached get    {hit * 1000:8.3f} ms')
+            print(f'to JSON dict  {serialize * 1000:8.1f} ms')
+            print(f'{len(result.overlaps)} overlaps, '
+                  f'mean utilization {sum(u.utilization for u in result.users) / len(result.users):.2f}')
+            db.engine.dispose()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,128 @@
+"""Fill the database with synthetic users, projects, entries and assignments.
+
+Used by the other benchmarks, or on its own to build a database file to
+point the app at:
+
+    python -m benchmarks.datagen --db /tmp/loom.db --users 200 --projects 500 --years 5
+
+Every user's password is their username; user1 is an admin.
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+from collections import namedtuple
+from datetime import date, timedelta
+
+from sqlalchemy import insert
+from werkzeug.security import generate_password_hash
+
+from app import create_app, db, rollup
+from app.models import Project, ProjectAssignment, TimeEntry, User
+
+BATCH_SIZE = 50000
+HOURS = (1.0, 2.0, 2.5, 4.0)
+
+Dataset = namedtuple('Dataset', 'start end users projects entries assignments')
+
+
+def bench_config(workdir, database=None, **overrides):
+    """create_app() settings keeping a benchmark's database and runtime files in workdir.
+
+    Version counters, the export cache and backups would otherwise land in
+    the real instance/ folder. database defaults to workdir/bench.db.
+    """
+    return dict({
+        'SQLALCHEMY_DATABASE_URI': 'sqlite:///' + (database or os.path.join(workdir, 'bench.db')),
+        'VERSIONS_FILE': os.path.join(workdir, 'versions.bin'),
+        'EXPORT_CACHE_DIR': os.path.join(workdir, 'exports'),
+        'BACKUP_DIR': os.path.join(workdir, 'backups'),
+    }, **overrides)
+
+
+def _insert_batches(model, rows):
+    for offset in range(0, len(rows), BATCH_SIZE):
+        db.session.execute(insert(model), rows[offset:offset + BATCH_SIZE])
+
+
+def generate(users=200, projects=500, years=5, seed=0, entries_per_day=(1, 3), assignments=True,
+             end=None):
+    """Insert the dataset inside the current app context and commit. Returns a Dataset.
+
+    Entries cover every weekday of the last `years` years for every user,
+    entries_per_day (min, max) per day; assignments run back to back per
+    user with occasional overlaps. The daily_hours rollup is rebuilt.
+    """
+    rng = random.Random(seed)
+    end = end or date.today()
+    start = end - timedelta(days=365 * years)
+
+    # Hashing is deliberately slow; do it once per user, with cheap settings
+    db.session.execute(insert(User), [
+        {'id': i, 'username': f'user{i}', 'is_admin': i == 1, 'is_active': True,
+         'password': generate_password_hash(f'user{i}', method='pbkdf2:sha256:1000')}
+        for i in range(1, users + 1)
+    ])
+    db.session.execute(insert(Project), [
+        {'id': i, 'name': f'project{i}', 'is_active': True}
+        for i in range(1, projects + 1)
+    ])
+
+    entry_count = 0
+    rows = []
+    low, high = entries_per_day
+    for offset in range((end - start).days):
+        day = start + timedelta(days=offset)
+        if day.weekday() >= 5:
+            continue
+        for user_id in range(1, users + 1):
+            for _ in range(rng.randint(low, high)):
+                rows.append({'user_id': user_id, 'project_id': rng.randint(1, projects),
+                             'date': day, 'hours': rng.choice(HOURS)})
+        if len(rows) >= BATCH_SIZE:
+            _insert_batches(TimeEntry, rows)
+            entry_count += len(rows)
+            rows = []
+    _insert_batches(TimeEntry, rows)
+    entry_count += len(rows)
+
+    rows = []
+    if assignments:
+        for user_id in range(1, users + 1):
+            day = start
+            while day < end:
+                length = rng.randint(3, 30)
+                rows.append({'user_id': user_id, 'project_id': rng.randint(1, projects),
+                             'start_date': day, 'end_date': day + timedelta(days=length - 1)})
+                # Usually the next assignment follows on; sometimes it overlaps
+                day += timedelta(days=length - (rng.randint(1, 5) if rng.random() < 0.2 else 0))
+        _insert_batches(ProjectAssignment, rows)
+
+    db.session.commit()
+    rollup.rebuild()
+    return Dataset(start, end, users, projects, entry_count, len(rows))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--db', required=True, help='SQLite file to create')
+    parser.add_argument('--users', type=int, default=200)
+    parser.add_argument('--projects', type=int, default=500)
+    parser.add_argument('--years', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        app = create_app(bench_config(tmpdir, os.path.abspath(args.db)))
+        with app.app_context():
+            started = time.perf_counter()
+            dataset = generate(args.users, args.projects, args.years, args.seed)
+            print(f'{dataset.entries} time entries and {dataset.assignments} assignments for '
+                  f'{dataset.users} users on {dataset.projects} projects, {dataset.start} to {dataset.end} '
+                  f'({time.perf_counter() - started:.1f}s)')
+            db.engine.dispose()
+
+
+if __name__ == '__main__':
+    main()
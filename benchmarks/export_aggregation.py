@@ -0,0 +1,74 @@
+"""Compare pandas-side and SQL-side export aggregation.
+
+Builds a throwaway SQLite database with several years of synthetic time
+entries and times both ways of producing the aggregated export rows:
+
+    python -m benchmarks.export_aggregation --users 50 --projects 100 --years 5
+"""
+import argparse
+import tempfile
+import time
+
+import pandas as pd
+
+from app import create_app, db, export
+from app.models import TimeEntry, Project, User
+from benchmarks.datagen import bench_config, generate
+
+
+def pandas_path(start_date, end_date, aggregate_by):
+    # The export as it was before aggregation moved into SQL.
+    entries = TimeEntry.query.join(Project).join(User).filter(
+        TimeEntry.date.between(start_date, end_date)
+    ).all()
+    df = pd.DataFrame([{
+        'Date': entry.date.strftime('%Y-%m-%d'),
+        'Project': entry.project.name,
+        'User': entry.user.username,
+        'Hours': entry.hours
+    } for entry in entries])
+    df = df.sort_values('Date')
+    df = df.groupby(export.AGGREGATES[aggregate_by]).agg({'Hours': 'sum'}).reset_index()
+    return len(df), df['Hours'].sum()
+
+
+def sql_path(start_date, end_date, aggregate_by):
+    report = export.prepare_report(start_date, end_date, aggregate_by=aggregate_by)
+    return len(report.chunks[0]), report.total_hours
+
+
+def timed(func, *args):
+    db.session.expunge_all()
+    started = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - started, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--users', type=int, default=50)
+    parser.add_argument('--projects', type=int, default=100)
+    parser.add_argument('--years', type=int, default=5)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        app = create_app(bench_config(tmpdir))
+        with app.app_context():
+            dataset = generate(args.users, args.projects, args.years, assignments=False)
+            start_date, end_date = dataset.start, dataset.end
+            print(f'{dataset.entries} time entries, {args.users} users, {args.projects} projects, {args.years} years')
+            print(f'{"aggregate_by":<14}{"pandas (s)":>12}{"sql (s)":>12}{"speedup":>10}')
+
+            for aggregate_by in export.AGGREGATES:
+                old = min(timed(pandas_path, start_date, end_date, aggregate_by) for _ in range(args.repeat))
+                new = min(timed(sql_path, start_date, end_date, aggregate_by) for _ in range(args.repeat))
+                (old_rows, old_total), (new_rows, new_total) = old[1], new[1]
+                assert old_rows == new_rows and abs(old_total - new_total) < 1e-6, (old[1], new[1])
+                print(f'{aggregate_by:<14}{old[0]:>12.3f}{new[0]:>12.3f}{old[0] / new[0]:>9.1f}x')
+            db.session.remove()
+            db.engine.dispose()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,214 @@
+"""Load-test run.py over HTTP: single-process Waitress vs gunicorn worker counts.
+
+Starts the real server on a throwaway database for each configuration,
+drives it from --client-processes processes holding --clients keep-alive
+connections in total for --seconds, and reports throughput, latency and
+the speedup over the first configuration. Needs Unix for the multiproc
+runs; scaling is bounded by the cores left over for the clients:
+
+    python -m benchmarks.load --workers 1,2,4 --threads 4 --clients 32
+    python -m benchmarks.load --db /tmp/loom.db --seconds 30
+"""
+import argparse
+import http.client
+import json
+import multiprocessing
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import timedelta
+from urllib.parse import urlencode
+
+from app import create_app, db
+from benchmarks.datagen import bench_config, generate
+from benchmarks.routes import existing_dataset, percentile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HOST = '127.0.0.1'
+
+
+def request_mix(dataset):
+    """(weight, role, method, path, JSON body) for the requests the clients pick from."""
+    end = dataset.end
+    window = urlencode({'from': (end - timedelta(days=7)).isoformat(), 'to': (end + timedelta(days=14)).isoformat()})
+    month = {'start_date': (end - timedelta(days=30)).isoformat(), 'end_date': end.isoformat(), 'format': 'csv'}
+    return [
+        (4, 'user', 'GET', '/', None),
+        (3, 'user', 'GET', '/entries', None),
+        (2, 'admin', 'GET', f'/admin/assignments?{window}', None),
+        # A month of entries read with one SQL query and streamed out as CSV
+        # in chunks: long requests whose row formatting holds the GIL
+        (1, 'admin', 'POST', '/export', month),
+    ]
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind((HOST, 0))
+        return s.getsockname()[1]
+
+
+def start_server(mode, port, database, workers, threads, clients, workdir):
+    env = dict(
+        os.environ,
+        **{'LOOM_' + key: value for key, value in bench_config(workdir, database).items()},
+        LOOM_BACKUP_INTERVAL_HOURS='0',
+        LOOM_QUERY_DEBUG='false',
+        LOOM_SLOW_QUERY_THRESHOLD='null',
+    )
+    command = [sys.executable, os.path.join(ROOT, 'run.py'), '--mode', mode, '--host', HOST,
+               '--port', str(port), '--threads', str(threads), '--connection-limit', str(clients)]
+    if mode == 'multiproc':
+        command += ['--workers', str(workers)]
+    # cwd keeps run.py's app.log out of the checkout
+    server = subprocess.Popen(command, env=env, cwd=workdir,
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError(f'{" ".join(command)} exited with {server.returncode}')
+        try:
+            connection = http.client.HTTPConnection(HOST, port, timeout=1)
+            connection.request('GET', '/login')
+            if connection.getresponse().status == 200:
+                return server
+        except OSError:
+            time.sleep(0.2)
+    server.kill()
+    raise RuntimeError('server did not start within 30s')
+
+
+def login(connection, username):
+    body = urlencode({'username': username, 'password': username})
+    connection.request('POST', '/login', body, {'Content-Type': 'application/x-www-form-urlencoded'})
+    response = connection.getresponse()
+    response.read()
+    cookie = response.getheader('Set-Cookie', '')
+    assert response.status == 302 and cookie, f'login as {username} failed'
+    return cookie.split(';', 1)[0]
+
+
+def client(port, mix, username, seconds, seed, results):
+    rng = random.Random(seed)
+    connection = http.client.HTTPConnection(HOST, port, timeout=120)
+    cookies = {'admin': login(connection, 'user1'), 'user': login(connection, username)}
+    weights = [weight for weight, *_ in mix]
+    latencies, errors = [], 0
+
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        _, role, method, path, body = rng.choices(mix, weights)[0]
+        headers = {'Cookie': cookies[role]}
+        if body is not None:
+            body = json.dumps(body)
+            headers['Content-Type'] = 'application/json'
+        started = time.perf_counter()
+        try:
+            connection.request(method, path, body, headers)
+            response = connection.getresponse()
+            response.read()
+            if response.status >= 400:
+                errors += 1
+        except (OSError, http.client.HTTPException):
+            errors += 1
+            connection.close()
+            continue
+        latencies.append(time.perf_counter() - started)
+    connection.close()
+    results.append((latencies, errors))
+
+
+def client_process(port, mix, users, connections, seconds, seed):
+    results = []
+    threads = [
+        threading.Thread(target=client, args=(port, mix, f'user{2 + (seed + i) % (users - 1)}',
+                                              seconds, seed + i, results))
+        for i in range(connections)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    latencies = [latency for thread_latencies, _ in results for latency in thread_latencies]
+    return latencies, sum(errors for _, errors in results)
+
+
+def run_load(port, mix, users, args):
+    per_process = [args.clients // args.client_processes + (i < args.clients % args.client_processes)
+                   for i in range(args.client_processes)]
+    with multiprocessing.get_context('fork').Pool(args.client_processes) as pool:
+        outcomes = pool.starmap(client_process, [
+            (port, mix, users, connections, args.seconds, i * 1000)
+            for i, connections in enumerate(per_process) if connections
+        ])
+    latencies = [latency for process_latencies, _ in outcomes for latency in process_latencies]
+    return latencies, sum(errors for _, errors in outcomes)
+
+
+def configurations(args):
+    yield f'waitress, {args.threads} threads', 'deploy', 1
+    for workers in args.workers:
+        yield f'gunicorn, {workers} x {args.threads} threads', 'multiproc', workers
+
+
+def run(database, dataset, args):
+    mix = request_mix(dataset)
+    print(f'{os.cpu_count()} CPUs, {args.clients} connections from {args.client_processes} '
+          f'client processes, {args.seconds}s per run\n')
+    print(f'{"server":<30}{"req/s":>9}{"p50 ms":>9}{"p99 ms":>9}{"errors":>8}{"speedup":>9}')
+
+    baseline = None
+    with tempfile.TemporaryDirectory() as workdir:
+        for name, mode, workers in configurations(args):
+            port = free_port()
+            server = start_server(mode, port, database, workers, args.threads, args.clients, workdir)
+            try:
+                latencies, errors = run_load(port, mix, dataset.users, args)
+            finally:
+                server.terminate()
+                server.wait(30)
+            throughput = len(latencies) / args.seconds
+            baseline = baseline or throughput
+            print(f'{name:<30}{throughput:>9.1f}{statistics.median(latencies) * 1000:>9.1f}'
+                  f'{percentile(latencies, 0.99) * 1000:>9.1f}{errors:>8}{throughput / baseline:>8.2f}x')
+
+
+def main():
+    cpus = os.cpu_count() or 1
+    default_workers = sorted({1, 2, max(1, cpus // 2), cpus})
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--db', help='reuse a database built by benchmarks.datagen')
+    parser.add_argument('--users', type=int, default=50)
+    parser.add_argument('--projects', type=int, default=100)
+    parser.add_argument('--years', type=int, default=1)
+    parser.add_argument('--workers', type=lambda value: [int(n) for n in value.split(',')],
+                        default=default_workers, help='comma-separated gunicorn worker counts')
+    parser.add_argument('--threads', type=int, default=4)
+    parser.add_argument('--clients', type=int, default=32, help='concurrent connections')
+    parser.add_argument('--client-processes', type=int, default=2)
+    parser.add_argument('--seconds', type=float, default=15)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        database = os.path.abspath(args.db) if args.db else os.path.join(tmpdir, 'bench.db')
+        app = create_app(bench_config(tmpdir, database))
+        if args.db:
+            dataset = existing_dataset(app)
+        else:
+            with app.app_context():
+                dataset = generate(args.users, args.projects, args.years)
+                print(f'{dataset.entries} time entries, {dataset.assignments} assignments')
+        with app.app_context():
+            db.engine.dispose()
+        run(database, dataset, args)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,207 @@
+"""Drive the main routes through the Flask test client and time them.
+
+Fills a throwaway database with benchmarks.datagen (or reuses one made
+with it), then for every scenario reports p50/p99 latency over --iterations
+requests and the peak Python memory of a few extra traced requests.
+Results are written to benchmarks/results/ and compared with the previous
+run there:
+
+    python -m benchmarks.routes --users 200 --projects 500 --years 5
+    python -m benchmarks.routes --db /tmp/loom.db --iterations 200
+"""
+import argparse
+import glob
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import tempfile
+import time
+import tracemalloc
+from collections import namedtuple
+from datetime import datetime, timedelta
+
+from sqlalchemy import func, select
+
+from app import create_app, dashboard, db, entries
+from app.models import Project, TimeEntry, User
+from benchmarks.datagen import Dataset, bench_config, generate
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results')
+MEMORY_ITERATIONS = 5
+
+# setup runs before every request and isn't timed; request(client) returns a response.
+Scenario = namedtuple('Scenario', 'name role request setup')
+
+
+def scenarios(dataset, rng):
+    end = dataset.end
+    deep_date = end - timedelta(days=365 * 3)
+
+    def post_json(url, body):
+        return lambda client: client.post(url, json=body)
+
+    def add_entry(client):
+        day = end - timedelta(days=rng.randrange(365))
+        return client.post('/add_entry', json={'date': day.isoformat(), 'entries': [
+            {'project_id': rng.randint(1, dataset.projects), 'hours': 1.5},
+            {'project_id': rng.randint(1, dataset.projects), 'hours': 2.5},
+        ]})
+
+    month = {'start_date': (end - timedelta(days=30)).isoformat(), 'end_date': end.isoformat()}
+    year = {'start_date': (end - timedelta(days=365)).isoformat(), 'end_date': end.isoformat()}
+    window = f'from={(end - timedelta(days=7)).isoformat()}&to={(end + timedelta(days=14)).isoformat()}'
+    return [
+        # The summary cache is cleared so every request pays for the queries
+        Scenario('index', 'user', lambda client: client.get('/'), dashboard._cache.clear),
+        Scenario('index (cached)', 'user', lambda client: client.get('/'), None),
+        Scenario('export_data xlsx 30d', 'admin', post_json('/export', dict(month, format='xlsx')), None),
+        Scenario('export_data csv 30d', 'admin', post_json('/export', dict(month, format='csv')), None),
+        Scenario('export_data by project/user 1y', 'admin',
+                 post_json('/export', dict(year, format='xlsx', aggregate_by='project_user')), None),
+        Scenario('my_entries', 'user', lambda client: client.get('/my_entries'), None),
+        Scenario('entries first page', 'user', lambda client: client.get('/entries'), None),
+        Scenario('entries page 3y back', 'user',
+                 lambda client: client.get(f'/entries?cursor={entries.encode_cursor(deep_date, 2**31)}'), None),
+        Scenario('admin_timeline', 'admin', lambda client: client.get('/admin/timeline'), None),
+        Scenario('admin assignments window', 'admin', lambda client: client.get(f'/admin/assignments?{window}'), None),
+        Scenario('add_entry', 'user', add_entry, None),
+    ]
+
+
+def login(app, username):
+    client = app.test_client()
+    response = client.post('/login', data={'username': username, 'password': username})
+    assert response.status_code == 302, f'login as {username} failed'
+    return client
+
+
+def run_request(scenario, client):
+    if scenario.setup:
+        scenario.setup()
+    started = time.perf_counter()
+    response = scenario.request(client)
+    response.get_data()  # drain streamed bodies
+    elapsed = time.perf_counter() - started
+    assert response.status_code < 400, f'{scenario.name}: HTTP {response.status_code}'
+    return elapsed
+
+
+def percentile(samples, fraction):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def measure(scenario, client, iterations):
+    run_request(scenario, client)  # warm up
+    latencies = [run_request(scenario, client) for _ in range(iterations)]
+
+    tracemalloc.start()
+    peak = 0
+    for _ in range(MEMORY_ITERATIONS):
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+        run_request(scenario, client)
+        peak = max(peak, tracemalloc.get_traced_memory()[1] - baseline)
+    tracemalloc.stop()
+
+    return {
+        'p50_ms': statistics.median(latencies) * 1000,
+        'p99_ms': percentile(latencies, 0.99) * 1000,
+        'mean_ms': statistics.fmean(latencies) * 1000,
+        'peak_kb': peak / 1024,
+    }
+
+
+def git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              check=True, cwd=os.path.dirname(RESULTS_DIR)).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def previous_results():
+    runs = sorted(glob.glob(os.path.join(RESULTS_DIR, 'routes-*.json')))
+    if not runs:
+        return None, {}
+    with open(runs[-1]) as f:
+        return runs[-1], json.load(f)['results']
+
+
+def change(current, previous):
+    if not previous:
+        return ''
+    return f'{(current - previous) / previous * 100:+.0f}%'
+
+
+def existing_dataset(app):
+    with app.app_context():
+        first, last, count = db.session.execute(
+            select(func.min(TimeEntry.date), func.max(TimeEntry.date), func.count())
+        ).one()
+        users = db.session.scalar(select(func.count()).select_from(User))
+        projects = db.session.scalar(select(func.count()).select_from(Project))
+    return Dataset(first, last, users, projects, count, None)
+
+
+def run(app, dataset, args):
+    rng = random.Random(args.seed)
+    clients = {'admin': login(app, 'user1'), 'user': login(app, 'user2')}
+    compared_with, previous = previous_results()
+
+    print(f'{"scenario":<34}{"p50 ms":>9}{"p99 ms":>9}{"peak KB":>10}{"p50 vs last":>13}')
+    results = {}
+    for scenario in scenarios(dataset, rng):
+        if args.only and args.only not in scenario.name:
+            continue
+        result = measure(scenario, clients[scenario.role], args.iterations)
+        results[scenario.name] = result
+        last = previous.get(scenario.name, {})
+        print(f'{scenario.name:<34}{result["p50_ms"]:>9.1f}{result["p99_ms"]:>9.1f}'
+              f'{result["peak_kb"]:>10.0f}{change(result["p50_ms"], last.get("p50_ms")):>13}')
+
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    path = os.path.join(RESULTS_DIR, f'routes-{datetime.now().strftime("%Y%m%d-%H%M%S")}.json')
+    with open(path, 'w') as f:
+        json.dump({
+            'revision': git_revision(),
+            'python': platform.python_version(),
+            'dataset': dict(dataset._asdict(), start=str(dataset.start), end=str(dataset.end)),
+            'iterations': args.iterations,
+            'results': results,
+        }, f, indent=2)
+    print(f'\nSaved {path}' + (f', compared with {os.path.basename(compared_with)}' if compared_with else ''))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--db', help='reuse a database built by benchmarks.datagen')
+    parser.add_argument('--users', type=int, default=200)
+    parser.add_argument('--projects', type=int, default=500)
+    parser.add_argument('--years', type=int, default=5)
+    parser.add_argument('--iterations', type=int, default=100)
+    parser.add_argument('--only', help='run the scenarios whose name contains this')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        database = os.path.abspath(args.db) if args.db else None
+        app = create_app(bench_config(tmpdir, database, QUERY_DEBUG=False, SLOW_QUERY_THRESHOLD=None))
+        if database:
+            dataset = existing_dataset(app)
+        else:
+            with app.app_context():
+                started = time.perf_counter()
+                dataset = generate(args.users, args.projects, args.years, args.seed)
+                print(f'{dataset.entries} time entries, {dataset.assignments} assignments '
+                      f'({time.perf_counter() - started:.1f}s to generate)\n')
+        run(app, dataset, args)
+        with app.app_context():
+            db.engine.dispose()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,108 @@
+"""Measure reader latency while a writer commits, per SQLite profile.
+
+Runs the same workload twice against a throwaway database: once with
+SQLite's defaults (rollback journal) and once with the tuned pragma
+profile from app.database (WAL, busy_timeout, ...). Reader threads run
+dashboard summary queries while one writer keeps committing batches of
+time entries, holding the write lock for --hold ms per transaction the way
+a large import or bulk fill does:
+
+    python -m benchmarks.sqlite_concurrency --readers 8 --seconds 10
+"""
+import argparse
+import random
+import statistics
+import tempfile
+import threading
+import time
+from datetime import date, timedelta
+
+from sqlalchemy import insert
+from sqlalchemy.exc import OperationalError
+
+from app import create_app, dashboard, db
+from app.database import DEFAULT_PRAGMAS
+from app.models import TimeEntry
+from benchmarks.datagen import bench_config, generate
+
+
+def writer(app, stop, args, stats):
+    rng = random.Random(1)
+    with app.app_context():
+        while not stop.is_set():
+            day = date.today() - timedelta(days=rng.randrange(365))
+            rows = [{'user_id': rng.randint(1, 20), 'project_id': rng.randint(1, 50),
+                     'date': day, 'hours': 1.0} for _ in range(args.batch)]
+            try:
+                with db.engine.connect() as connection:
+                    # Take the write lock up front, as SQLite does when a
+                    # big transaction spills to disk or reaches COMMIT.
+                    connection.exec_driver_sql('BEGIN EXCLUSIVE')
+                    connection.execute(insert(TimeEntry), rows)
+                    time.sleep(args.hold / 1000)
+                    connection.exec_driver_sql('COMMIT')
+                stats['commits'] += 1
+            except OperationalError:
+                stats['errors'] += 1
+            time.sleep(args.pause / 1000)
+
+
+def reader(app, stop, stats):
+    rng = random.Random(threading.get_ident())
+    with app.app_context():
+        while not stop.is_set():
+            started = time.perf_counter()
+            try:
+                db.session.execute(dashboard.summary_query(rng.randint(1, 20), date.today())).all()
+                # The rollup is empty here; also hit time_entry like an export would
+                db.session.query(TimeEntry.id).filter(TimeEntry.user_id == rng.randint(1, 20)).count()
+                db.session.commit()
+            except OperationalError:
+                db.session.rollback()
+                stats['errors'] += 1
+                continue
+            stats['read_latency'].append(time.perf_counter() - started)
+
+
+def run(profile, pragmas, args):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        app = create_app(bench_config(tmpdir, SQLITE_PRAGMAS=pragmas))
+        with app.app_context():
+            generate(20, 50, 1, assignments=False)
+
+        stats = {'commits': 0, 'errors': 0, 'read_latency': []}
+        stop = threading.Event()
+        threads = [threading.Thread(target=writer, args=(app, stop, args, stats))]
+        threads += [threading.Thread(target=reader, args=(app, stop, stats)) for _ in range(args.readers)]
+        for thread in threads:
+            thread.start()
+        time.sleep(args.seconds)
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+        with app.app_context():
+            db.engine.dispose()
+
+    reads = sorted(stats['read_latency'])
+    p99 = reads[int(len(reads) * 0.99) - 1] if reads else float('nan')
+    print(f'{profile:<10}{len(reads) / args.seconds:>10.0f}{statistics.median(reads) * 1000:>10.1f}'
+          f'{p99 * 1000:>10.1f}{reads[-1] * 1000:>10.1f}{stats["commits"]:>9}{stats["errors"]:>8}')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--readers', type=int, default=8)
+    parser.add_argument('--seconds', type=float, default=10)
+    parser.add_argument('--batch', type=int, default=500, help='rows per write transaction')
+    parser.add_argument('--hold', type=float, default=50, help='ms the writer keeps the lock per transaction')
+    parser.add_argument('--pause', type=float, default=10, help='ms between write transactions')
+    args = parser.parse_args()
+
+    print(f'{"profile":<10}{"reads/s":>10}{"p50 ms":>10}{"p99 ms":>10}{"max ms":>10}{"commits":>9}{"errors":>8}')
+    run('default', {}, args)
+    run('tuned', DEFAULT_PRAGMAS, args)
+
+
+if __name__ == '__main__':
+    main()
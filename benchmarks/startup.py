@@ -0,0 +1,83 @@
+"""Measure cold start: import time, create_app() time and resident memory.
+
+Each sample runs in a fresh interpreter so nothing is already imported:
+
+    python -m benchmarks.startup --runs 5
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+from benchmarks.datagen import bench_config
+
+# Runs in the child interpreter; prints one JSON line.
+PROBE = r'''
+import json, sys, time
+started = time.perf_counter()
+from app import create_app
+imported = time.perf_counter()
+app = create_app(json.loads(sys.argv[1]))
+created = time.perf_counter()
+
+def rss_mb():
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss / 2**20
+    except ImportError:
+        pass
+    try:
+        with open('/proc/self/status') as status:
+            for line in status:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    import resource
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+heavy = ['pandas', 'numpy', 'pyarrow', 'xlsxwriter', 'alembic']
+print(json.dumps({
+    'import': imported - started,
+    'create_app': created - imported,
+    'rss': rss_mb(),
+    'loaded': [name for name in heavy if name in sys.modules],
+}))
+'''
+
+
+def sample(config):
+    output = subprocess.run(
+        [sys.executable, '-c', PROBE, json.dumps(config)],
+        capture_output=True, text=True, check=True,
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        variants = {
+            'create_all': bench_config(tmpdir),
+            'skip create_all': bench_config(tmpdir, CREATE_ALL_ON_STARTUP=False),
+            'with migrations': bench_config(tmpdir, CREATE_ALL_ON_STARTUP=False, LOAD_MIGRATIONS=True),
+        }
+        print(f'{"variant":<18}{"import ms":>11}{"create ms":>11}{"rss MB":>9}  heavy modules loaded')
+        for name, config in variants.items():
+            samples = [sample(config) for _ in range(args.runs)]
+            print(f'{name:<18}'
+                  f'{statistics.median(s["import"] for s in samples) * 1000:>11.1f}'
+                  f'{statistics.median(s["create_app"] for s in samples) * 1000:>11.1f}'
+                  f'{statistics.median(s["rss"] for s in samples):>9.1f}  '
+                  f'{", ".join(samples[-1]["loaded"]) or "-"}')
+
+
+if __name__ == '__main__':
+    main()
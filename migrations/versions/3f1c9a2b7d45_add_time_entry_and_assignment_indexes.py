@@ -0,0 +1,42 @@
+"""Add composite indexes for time entry and assignment lookups
+
+Revision ID: 3f1c9a2b7d45
+Revises: d8aae20cf9e4
+Create Date: 2026-10-18 09:12:41.204518
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f1c9a2b7d45'
+down_revision = 'd8aae20cf9e4'
+branch_labels = None
+depends_on = None
+
+
+INDEXES = [
+    ('ix_time_entry_user_id_date', 'time_entry', ['user_id', 'date']),
+    ('ix_time_entry_project_id_date', 'time_entry', ['project_id', 'date']),
+    ('ix_project_assignment_user_id_start_date_end_date', 'project_assignment',
+     ['user_id', 'start_date', 'end_date']),
+]
+
+
+def _existing_indexes(table):
+    return {index['name'] for index in sa.inspect(op.get_bind()).get_indexes(table)}
+
+
+def upgrade():
+    # db.create_all() already builds these on a fresh database, so only add
+    # the ones that are missing.
+    for name, table, columns in INDEXES:
+        if name not in _existing_indexes(table):
+            op.create_index(name, table, columns, unique=False)
+
+
+def downgrade():
+    for name, table, columns in reversed(INDEXES):
+        if name in _existing_indexes(table):
+            op.drop_index(name, table_name=table)
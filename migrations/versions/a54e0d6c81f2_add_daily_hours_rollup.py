@@ -0,0 +1,43 @@
+"""Add daily_hours rollup table
+
+Revision ID: a54e0d6c81f2
+Revises: 3f1c9a2b7d45
+Create Date: 2026-10-18 10:03:17.552903
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a54e0d6c81f2'
+down_revision = '3f1c9a2b7d45'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # db.create_all() may already have created an empty table on startup.
+    if not sa.inspect(op.get_bind()).has_table('daily_hours'):
+        op.create_table(
+            'daily_hours',
+            sa.Column('user_id', sa.Integer(), nullable=False),
+            sa.Column('project_id', sa.Integer(), nullable=False),
+            sa.Column('day', sa.Date(), nullable=False),
+            sa.Column('hours', sa.Float(), nullable=False),
+            sa.ForeignKeyConstraint(['project_id'], ['project.id'], ),
+            sa.ForeignKeyConstraint(['user_id'], ['user.id'], ),
+            sa.PrimaryKeyConstraint('user_id', 'day', 'project_id')
+        )
+
+    # Backfill from the raw entries; `flask rollup verify` checks the result.
+    op.execute('DELETE FROM daily_hours')
+    op.execute(
+        'INSERT INTO daily_hours (user_id, project_id, day, hours) '
+        'SELECT user_id, project_id, date, SUM(hours) FROM time_entry '
+        'GROUP BY user_id, project_id, date'
+    )
+
+
+def downgrade():
+    op.drop_table('daily_hours')
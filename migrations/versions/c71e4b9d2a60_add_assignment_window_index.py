@@ -0,0 +1,34 @@
+"""Add (end_date, start_date) index for timeline window queries
+
+Revision ID: c71e4b9d2a60
+Revises: a54e0d6c81f2
+Create Date: 2026-10-18 11:26:08.913374
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c71e4b9d2a60'
+down_revision = 'a54e0d6c81f2'
+branch_labels = None
+depends_on = None
+
+
+NAME = 'ix_project_assignment_end_date_start_date'
+
+
+def _existing_indexes():
+    return {index['name'] for index in sa.inspect(op.get_bind()).get_indexes('project_assignment')}
+
+
+def upgrade():
+    # db.create_all() already builds it on a fresh database.
+    if NAME not in _existing_indexes():
+        op.create_index(NAME, 'project_assignment', ['end_date', 'start_date'], unique=False)
+
+
+def downgrade():
+    if NAME in _existing_indexes():
+        op.drop_index(NAME, table_name='project_assignment')
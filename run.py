@@ -1,11 +1,11 @@
 # TODO:
 # add logging
-# Add DB automatic backup
 
 from waitress import serve
-from app import create_app
+from app import create_app, backup, db
 import argparse
 import logging
+import os
 import sys
 
 # Configure logging
@@ -17,24 +17,103 @@ logging.basicConfig(
 
 app = create_app()
 
+DEFAULT_BIND = {
+    'local': ('localhost', 8080),
+    'deploy': ('192.168.3.100', 80),
+    'multiproc': ('192.168.3.100', 80),
+}
+
+
+def serve_multiproc(app, host, port, workers, threads, connection_limit, backlog, timeout):
+    """Serve with gunicorn: `workers` processes forked from this one, which already loaded the app.
+
+    gunicorn exits the interpreter when the server stops.
+    """
+    # gunicorn needs fcntl, so it is only importable on Unix
+    from gunicorn.app.base import BaseApplication
+
+    def post_fork(server, worker):
+        # Connections opened while loading the app must not be shared with the children
+        with app.app_context():
+            db.engine.dispose(close=False)
+
+    def when_ready(server):
+        # Runs in the master only, so there is a single backup scheduler
+        backup.start_scheduler(app)
+
+    options = {
+        'bind': f'{host}:{port}',
+        'workers': workers,
+        'worker_class': 'gthread' if threads > 1 else 'sync',
+        'threads': threads,
+        'worker_connections': connection_limit,
+        'backlog': backlog,
+        'timeout': timeout,
+        'preload_app': True,
+        'post_fork': post_fork,
+        'when_ready': when_ready,
+    }
+
+    class Server(BaseApplication):
+        def load_config(self):
+            for key, value in options.items():
+                self.cfg.set(key, value)
+
+        def load(self):
+            return app
+
+    Server().run()
+
+
 if __name__ == '__main__':
     parser = argparse.ArgumentParser(description='Run the Loom Tracker application.')
-    parser.add_argument('--mode', choices=['local', 'deploy'], default='local', help='Mode to run the application in (default: local)')
+    parser.add_argument('--mode', choices=['local', 'deploy', 'multiproc'], default='local',
+                        help='Mode to run the application in (default: local); multiproc serves '
+                             'with several gunicorn worker processes (Unix only)')
+    parser.add_argument('--host', help='Address to bind (default depends on --mode)')
+    parser.add_argument('--port', type=int, help='Port to bind (default depends on --mode)')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help='multiproc: worker processes (default: one per CPU)')
+    parser.add_argument('--threads', type=int, default=4,
+                        help='Request threads per process (default: 4)')
+    parser.add_argument('--connection-limit', type=int, default=100,
+                        help='Open connections per process (default: 100)')
+    parser.add_argument('--backlog', type=int, default=1024,
+                        help='Listen backlog (default: 1024)')
+    parser.add_argument('--timeout', type=int, default=120,
+                        help='multiproc: seconds before a silent worker is restarted (default: 120)')
     args = parser.parse_args()
-    
+
+    host, port = DEFAULT_BIND[args.mode]
+    host = args.host or host
+    port = args.port or port
+
+    if args.mode == 'multiproc':
+        try:
+            serve_multiproc(app, host, port, args.workers, args.threads,
+                            args.connection_limit, args.backlog, args.timeout)
+        except ImportError as e:
+            print(f"Error: multiproc mode needs gunicorn, which only runs on Unix ({e})")
+            print("Use --mode deploy instead")
+            sys.exit(1)
+
+    # Periodic online DB backup (BACKUP_INTERVAL_HOURS, 0 disables)
+    backup.start_scheduler(app)
+
     try:
         if args.mode == 'deploy':
             # For production on port 80
-            serve(app, host='192.168.3.100', port=80)
+            serve(app, host=host, port=port, threads=args.threads,
+                  connection_limit=args.connection_limit, backlog=args.backlog)
         else:
             # For development on port 8080
-            serve(app, host='localhost', port=8080)
+            serve(app, host=host, port=port, threads=args.threads)
     except PermissionError:
-        logging.error("Failed to bind to port 80. Try running as administrator.")
-        print("Error: Administrator privileges required to run on port 80")
+        logging.error(f"Failed to bind to port {port}. Try running as administrator.")
+        print(f"Error: Administrator privileges required to run on port {port}")
         print("Please run the script as administrator")
         sys.exit(1)
     except Exception as e:
         logging.error(f"Failed to start server: {e}")
         print(f"Error starting server: {e}")
-        sys.exit(1)
\ No newline at end of file
+        sys.exit(1)
@@ -0,0 +1,45 @@
+import pytest
+from werkzeug.security import generate_password_hash
+
+from app import create_app, db
+from app.models import Project, User
+
+
+@pytest.fixture
+def app(tmp_path):
+    app = create_app({
+        'SQLALCHEMY_DATABASE_URI': f'sqlite:///{tmp_path / "test.db"}',
+        'TESTING': True,
+        'QUERY_COUNT_HEADER': True,
+        'VERSIONS_FILE': str(tmp_path / 'versions.bin'),
+        'EXPORT_CACHE_DIR': str(tmp_path / 'exports'),
+    })
+    with app.app_context():
+        db.session.add_all([
+            User(username='admin', password=generate_password_hash('admin'), is_admin=True, is_active=True),
+            User(username='bob', password=generate_password_hash('bob'), is_admin=False, is_active=True),
+            Project(name='P1', is_active=True),
+            Project(name='P2', is_active=True),
+        ])
+        db.session.commit()
+    yield app
+    with app.app_context():
+        db.engine.dispose()
+
+
+@pytest.fixture
+def client(app):
+    client = app.test_client()
+    response = client.post('/login', data={'username': 'bob', 'password': 'bob'})
+    assert response.status_code == 302
+    return client
+
+
+@pytest.fixture
+def projects(app):
+    with app.app_context():
+        return [project.id for project in Project.query.order_by(Project.id)]
+
+
+def query_count(response):
+    return int(response.headers['X-Query-Count'])
@@ -0,0 +1,34 @@
+import hashlib
+import io
+
+import pytest
+
+from app import assets
+
+
+def test_committed_build_is_fresh(app):
+    # Fresh by pinned hashes alone, so a checkout without static/vendor serves it
+    files, fresh = assets.load_manifest(app)
+    assert fresh, 'run `flask assets build` and commit app/static/dist'
+    assert set(files) == set(assets.BUNDLES)
+
+
+def test_fetch_rejects_unpinned_content(app, tmp_path, monkeypatch):
+    path = 'vendor/lib-1.0/lib.js'
+    monkeypatch.setattr(assets, 'VENDOR', {
+        path: assets.Vendored('https://example.invalid/lib.js', hashlib.sha256(b'pinned').hexdigest()),
+    })
+    app.static_folder = str(tmp_path)
+
+    monkeypatch.setattr(assets.urllib.request, 'urlopen', lambda url, timeout: io.BytesIO(b'tampered'))
+    with pytest.raises(assets.AssetError):
+        assets.fetch(app)
+    assert not (tmp_path / path).exists()
+
+    monkeypatch.setattr(assets.urllib.request, 'urlopen', lambda url, timeout: io.BytesIO(b'pinned'))
+    assert assets.fetch(app) == [path]
+    assert assets.verify(app, path) == b'pinned'
+
+    (tmp_path / path).write_bytes(b'edited')
+    with pytest.raises(assets.AssetError):
+        assets.verify(app, path)
@@ -0,0 +1,67 @@
+from datetime import date, timedelta
+
+import pytest
+
+from app import db, rollup
+from app.models import TimeEntry
+from conftest import query_count
+
+START = date(2026, 1, 5)
+
+
+def create_ops(projects, size):
+    return [{'op': 'create', 'date': (START + timedelta(days=i)).isoformat(),
+             'project_id': projects[i % 2], 'hours': 1 + i % 3} for i in range(size)]
+
+
+def mixed_ops(projects, ids):
+    # Every update shape, deletes and creates, in proportion to the batch
+    shapes = [
+        lambda i, entry_id: {'op': 'delete', 'id': entry_id},
+        lambda i, entry_id: {'op': 'update', 'id': entry_id, 'hours': 5},
+        lambda i, entry_id: {'op': 'update', 'id': entry_id, 'project_id': projects[1]},
+        lambda i, entry_id: {'op': 'update', 'id': entry_id, 'date': (START - timedelta(days=i)).isoformat()},
+        lambda i, entry_id: {'op': 'update', 'id': entry_id, 'hours': 2, 'project_id': projects[0]},
+        lambda i, entry_id: {'op': 'create', 'date': (START + timedelta(days=i)).isoformat(),
+                             'project_id': projects[0], 'hours': 0.5},
+    ]
+    return [shapes[i % len(shapes)](i, entry_id) for i, entry_id in enumerate(ids)]
+
+
+def run_batch(client, operations):
+    response = client.post('/entries/batch', json={'operations': operations})
+    assert response.status_code == 200, response.json
+    return response
+
+
+def test_created_ids_match_operations(app, client, projects):
+    operations = create_ops(projects, 40)
+    results = run_batch(client, operations).json['results']
+    with app.app_context():
+        for operation, result in zip(operations, results):
+            entry = db.session.get(TimeEntry, result['id'])
+            assert (entry.date.isoformat(), entry.project_id, entry.hours) == (
+                operation['date'], operation['project_id'], operation['hours'])
+
+
+@pytest.mark.parametrize('size', [12, 120, 480])
+def test_statement_count_does_not_grow(app, client, projects, size):
+    ids = [result['id'] for result in run_batch(client, create_ops(projects, size)).json['results']]
+    small = run_batch(client, mixed_ops(projects, ids[:6]))
+    large = run_batch(client, mixed_ops(projects, ids[6:]))
+    assert query_count(large) == query_count(small)
+
+    with app.app_context():
+        assert not rollup.mismatches()
+        assert db.session.get(TimeEntry, ids[0]) is None
+        assert db.session.get(TimeEntry, ids[1]).hours == 5
+        assert db.session.get(TimeEntry, ids[2]).project_id == projects[1]
+        assert db.session.get(TimeEntry, ids[3]).date == START - timedelta(days=3)
+
+
+def test_invalid_batch_writes_nothing(app, client, projects):
+    response = client.post('/entries/batch', json={'operations': create_ops(projects, 3) + [{'op': 'nope'}]})
+    assert response.status_code == 400
+    assert [result['status'] for result in response.json['results']] == ['skipped'] * 3 + ['error']
+    with app.app_context():
+        assert TimeEntry.query.count() == 0
@@ -0,0 +1,41 @@
+import time
+
+EXPORT = {'start_date': '2026-10-01', 'end_date': '2026-10-31', 'format': 'csv'}
+
+
+def add_entry(client, project_id, hours):
+    response = client.post('/add_entry', json={'date': '2026-10-13', 'entries': [
+        {'project_id': project_id, 'hours': hours}]})
+    assert response.status_code == 200, response.json
+
+
+def run_export(client):
+    response = client.post('/export/jobs', json=EXPORT)
+    assert response.status_code == 202, response.json
+    job = response.json['job']
+    deadline = time.monotonic() + 30
+    while job['state'] in ('queued', 'running'):
+        assert time.monotonic() < deadline, 'export did not finish'
+        time.sleep(0.05)
+        job = client.get(f"/export/jobs/{job['id']}").json['job']
+    assert job['state'] == 'done', job
+    return job, client.get(f"/export/jobs/{job['id']}/download").get_data(as_text=True)
+
+
+def test_repeat_export_is_cached(client, projects):
+    add_entry(client, projects[0], 2)
+    first, body = run_export(client)
+    second, cached_body = run_export(client)
+    assert not first['cached'] and second['cached']
+    assert cached_body == body
+
+
+def test_edit_between_exports_is_not_served_stale(client, projects):
+    add_entry(client, projects[0], 2)
+    _, before = run_export(client)
+    assert '5.0' not in before
+
+    add_entry(client, projects[1], 5)
+    job, after = run_export(client)
+    assert not job['cached']
+    assert 'P2' in after and '5.0' in after
@@ -0,0 +1,10 @@
+from app import commands
+
+
+def test_hot_queries_use_indexes(app):
+    # The same check as `flask check-query-plans`, against the test schema
+    with app.app_context():
+        scans = {name: commands.full_scans(commands.explain(statement))
+                 for name, statement in commands.hot_queries().items()}
+    assert {name: steps for name, steps in scans.items() if steps} == {}
+    assert {'dashboard summary', 'entry history page', 'timeline window', 'export by user'} <= scans.keys()
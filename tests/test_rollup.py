@@ -0,0 +1,21 @@
+from datetime import date
+
+from app import create_app, db, rollup
+
+
+def test_startup_backfills_empty_rollup(app, projects):
+    # Entries written before daily_hours existed: create_all() makes the
+    # table, but only the migration would have filled it
+    with app.app_context():
+        db.session.execute(db.text(
+            "INSERT INTO time_entry (user_id, project_id, date, hours) VALUES (2, :project, :day, 3)"
+        ), {'project': projects[0], 'day': date.today()})
+        db.session.execute(db.text('DELETE FROM daily_hours'))
+        db.session.commit()
+        assert rollup.mismatches()
+
+    restarted = create_app(app.config)
+    with restarted.app_context():
+        assert not rollup.mismatches()
+        assert db.session.scalar(db.text('SELECT sum(hours) FROM daily_hours')) == 3
+        db.engine.dispose()
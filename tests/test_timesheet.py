@@ -0,0 +1,76 @@
+from datetime import date, timedelta
+
+from sqlalchemy import insert
+
+from app import db, rollup
+from app.models import Project, TimeEntry
+from conftest import query_count
+
+MONDAY = date(2026, 10, 12)
+
+
+def week_days():
+    return [(MONDAY + timedelta(days=offset)).isoformat() for offset in range(7)]
+
+
+def save(client, cells):
+    return client.post('/timesheet/week', json={'cells': cells})
+
+
+def test_full_week_within_budget(app, client):
+    with app.app_context():
+        db.session.add_all(Project(name=f'Extra {i}', is_active=True) for i in range(8))
+        db.session.commit()
+        project_ids = [project.id for project in Project.query.order_by(Project.id)]
+    assert len(project_ids) * 7 == 70
+
+    # All inserts, then all updates, then all clears
+    for hours in (1, 2.5, 0):
+        response = save(client, [{'project_id': project_id, 'date': day, 'hours': hours}
+                                 for project_id in project_ids for day in week_days()])
+        assert response.status_code == 200, response.json
+        assert query_count(response) <= 8
+
+        with app.app_context():
+            assert not rollup.mismatches()
+            assert TimeEntry.query.count() == (70 if hours else 0)
+            assert {entry.hours for entry in TimeEntry.query} <= {hours}
+
+
+def test_cells_collapse_and_clear(app, client, projects):
+    p1, p2 = projects
+    with app.app_context():
+        db.session.execute(insert(TimeEntry), [
+            {'user_id': 2, 'project_id': p1, 'date': MONDAY, 'hours': 2},
+            {'user_id': 2, 'project_id': p1, 'date': MONDAY, 'hours': 3},
+            {'user_id': 2, 'project_id': p2, 'date': MONDAY, 'hours': 1},
+        ])
+        db.session.commit()
+        rollup.rebuild()
+
+    week = client.get('/timesheet/week?start=2026-10-14').json
+    assert week['week_start'] == MONDAY.isoformat()
+    assert {p['id']: p['hours'] for p in week['projects']} == {p1: {'2026-10-12': 5.0}, p2: {'2026-10-12': 1.0}}
+
+    response = save(client, [
+        {'project_id': p1, 'date': '2026-10-12', 'hours': 4},
+        {'project_id': p2, 'date': '2026-10-12', 'hours': 0},
+        {'project_id': p2, 'date': '2026-10-13', 'hours': 2.5},
+    ])
+    assert response.status_code == 200, response.json
+    with app.app_context():
+        assert not rollup.mismatches()
+        rows = [(entry.project_id, entry.date.isoformat(), entry.hours)
+                for entry in TimeEntry.query.order_by(TimeEntry.date, TimeEntry.project_id)]
+    assert rows == [(p1, '2026-10-12', 4.0), (p2, '2026-10-13', 2.5)]
+
+
+def test_invalid_cells_write_nothing(app, client, projects):
+    response = save(client, [
+        {'project_id': projects[0], 'date': '2026-10-12', 'hours': 4},
+        {'project_id': 999, 'date': '2026-10-13', 'hours': 1},
+    ])
+    assert response.status_code == 400
+    assert [result['status'] for result in response.json['results']] == ['skipped', 'error']
+    with app.app_context():
+        assert TimeEntry.query.count() == 0
@@ -0,0 +1,52 @@
+import os
+import subprocess
+import sys
+
+from app import db, versions
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def env_for(app):
+    # A separate process started from the same database and versions file.
+    # It runs from tmp_path so nothing it writes (run.py's app.log, an
+    # instance/ default) lands in the checkout.
+    return dict(
+        os.environ,
+        PYTHONPATH=ROOT,
+        LOOM_SQLALCHEMY_DATABASE_URI=app.config['SQLALCHEMY_DATABASE_URI'],
+        LOOM_VERSIONS_FILE=app.config['VERSIONS_FILE'],
+        LOOM_EXPORT_CACHE_DIR=app.config['EXPORT_CACHE_DIR'],
+        LOOM_BACKUP_INTERVAL_HOURS='0',
+    )
+
+
+def flask(app, tmp_path, *args):
+    return subprocess.run([sys.executable, '-m', 'flask', '--app', 'app:create_app', *args],
+                          cwd=tmp_path, env=env_for(app), capture_output=True, text=True, check=True)
+
+
+def test_cli_writes_reach_running_server(app, client, projects, tmp_path):
+    response = client.get('/')
+    etag = response.headers['ETag']
+    assert client.get('/', headers={'If-None-Match': etag}).status_code == 304
+
+    # Written behind the rollup's back, then repaired from the CLI
+    with app.app_context():
+        db.session.execute(db.text(
+            "INSERT INTO time_entry (user_id, project_id, date, hours) VALUES (2, :project, date('now'), 3)"
+        ), {'project': projects[0]})
+        db.session.commit()
+    flask(app, tmp_path, 'rollup', 'rebuild')
+
+    response = client.get('/', headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert response.headers['ETag'] != etag
+
+
+def test_bump_from_another_process(app, tmp_path):
+    before = versions.snapshot('users', 'projects')
+    subprocess.run([sys.executable, '-c', 'from app import create_app, versions; '
+                    'create_app(); versions.bump("users")'], cwd=tmp_path, env=env_for(app), check=True)
+    after = versions.snapshot('users', 'projects')
+    assert after[0] != before[0] and after[1] == before[1]
@@ -34,9 +34,10 @@ class LoomTrackerService(win32serviceutil.ServiceFramework):
 
     def SvcDoRun(self):
         try:
-            from app import create_app
+            from app import create_app, backup
             from waitress import serve
             app = create_app()
+            backup.start_scheduler(app)
             serve(app, host='192.168.3.100', port=80)
         except Exception as e:
             servicemanager.LogErrorMsg(str(e))